@@ -23,6 +23,10 @@ DEFAULT_FORMATS = {
     "distance-dirty": "{version}.post{distance}+{vcs}{rev}.d{build_date:%Y%m%d}",
 }
 
+#: Regex matching the characters in a branch name that are replaced with
+#: periods in the ``{branch}`` field
+BRANCH_SANITIZE_RGX = re.compile(r"[^A-Za-z0-9.]")
+
 
 def basic_tag2version(*, tag: str, params: dict[str, Any]) -> str:
     """Implements the ``"basic"`` ``tag2version`` method"""
@@ -84,7 +88,7 @@ def basic_format(
     """Implements the ``"basic"`` ``format`` method"""
     branch: Optional[str]
     if description.branch is not None:
-        branch = re.sub(r"[^A-Za-z0-9.]", ".", description.branch)
+        branch = BRANCH_SANITIZE_RGX.sub(".", description.branch)
     else:
         branch = None
     fields = {
@@ -1,5 +1,8 @@
 from __future__ import annotations
+from copy import deepcopy
 from dataclasses import Field, dataclass, field, fields
+from functools import lru_cache
+import os
 from pathlib import Path
 import sys
 from typing import Any, Optional
@@ -20,6 +23,22 @@ else:
     from tomli import load as toml_load
 
 
+@lru_cache(maxsize=32)
+def load_toml_file(
+    filepath: str, inode: int, mtime_ns: int, size: int  # noqa: U100
+) -> dict[str, Any]:
+    """
+    Parse the TOML file at ``filepath``.  The results are cached, with the
+    file's inode number, modification time, and size included in the cache key
+    so that edits to the file are picked up; as a result, the return value
+    must not be modified.
+
+    :meta private:
+    """
+    with open(filepath, "rb") as fp:
+        return toml_load(fp)
+
+
 @dataclass
 class ConfigSection:
     """A parsed method subtable of the `versioningit` configuration"""
@@ -85,8 +104,14 @@ class Config:
             if the configuration table or any of its subfields are not of the
             correct type
         """
-        with open(filepath, "rb") as fp:
-            tool = toml_load(fp).get("tool", {})
+        st = os.stat(filepath)
+        # Copy the table, as the code below modifies it, and the original is
+        # cached
+        tool = deepcopy(
+            load_toml_file(
+                os.path.abspath(filepath), st.st_ino, st.st_mtime_ns, st.st_size
+            ).get("tool", {})
+        )
         table = tool.get("versioningit")
         try:
             hatch_config = tool["hatch"]["version"]
@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import os
 from pathlib import Path
+import re
 from typing import TYPE_CHECKING, Any, Optional
 from .config import Config
 from .errors import Error, MethodError, NotSdistError, NotVCSError, NotVersioningitError
@@ -13,6 +14,10 @@ from .util import is_sdist, parse_version_from_metadata
 if TYPE_CHECKING:
     from setuptools import Distribution
 
+#: Regex matching the blank line that ends the header block of a
+#: :file:`PKG-INFO` file, with either LF or CRLF line endings
+PKG_INFO_HEADER_END_RGX = re.compile(rb"\r?\n\r?\n")
+
 
 @dataclass
 class VCSDescription:
@@ -275,7 +280,7 @@ class Versioningit:
             if (
                 isinstance(e, NotVCSError)
                 and fallback
-                and (is_sdist(self.project_dir) or self.default_version is None)
+                and (self.default_version is None or is_sdist(self.project_dir))
             ):
                 log.info("Could not get VCS data from %s: %s", self.project_dir, str(e))
                 log.info("Falling back to reading from PKG-INFO")
@@ -544,11 +549,14 @@ def get_version_from_pkg_info(project_dir: str | Path) -> str:
         field
     """
     try:
-        return parse_version_from_metadata(
-            Path(project_dir, "PKG-INFO").read_text(encoding="utf-8")
-        )
+        data = Path(project_dir, "PKG-INFO").read_bytes()
     except FileNotFoundError:
         raise NotSdistError(f"{project_dir} does not contain a PKG-INFO file")
+    # Only the header block (everything before the first blank line) can
+    # contain the Version field, so there's no need to decode & split the
+    # (potentially long) description that follows it.
+    header = PKG_INFO_HEADER_END_RGX.split(data, maxsplit=1)[0]
+    return parse_version_from_metadata(header.decode("utf-8"))
 
 
 def run_onbuild(
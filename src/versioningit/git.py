@@ -35,6 +35,13 @@ TRUTH_VALUES = {
     "": False,
 }
 
+#: Regex for long-form `git describe` output (without "``-dirty``")
+DESCRIBE_RGX = re.compile(r"(?P<tag>.+)-(?P<distance>[0-9]+)-g(?P<rev>[0-9a-f]+)?")
+
+#: Regex for the ``$Format:%(describe[:options])$`` placeholder in
+#: ``.git_archival.txt``
+DESCRIBE_SUBST_RGX = re.compile(r"\$Format:%\(describe(?::(?P<options>.*))?\)\$")
+
 
 class Describe(NamedTuple):
     """
@@ -53,7 +60,7 @@ class Describe(NamedTuple):
 
     @classmethod
     def parse(cls, s: str) -> Describe:
-        m = re.fullmatch(r"(?P<tag>.+)-(?P<distance>[0-9]+)-g(?P<rev>[0-9a-f]+)?", s)
+        m = DESCRIBE_RGX.fullmatch(s)
         if not m:
             raise ValueError("Could not parse `git describe` output")
         tag = m["tag"]
@@ -72,7 +79,7 @@ class DescribeOpts:
 
     @classmethod
     def parse_describe_subst(cls, s: str) -> DescribeOpts:
-        m = re.fullmatch(r"\$Format:%\(describe(?::(?P<options>.*))?\)\$", s)
+        m = DESCRIBE_SUBST_RGX.fullmatch(s)
         if not m:
             raise ValueError(
                 f"Expected string in format '$Format:%(describe[:options])$', got {s!r}"
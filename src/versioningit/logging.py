@@ -1,5 +1,6 @@
 from __future__ import annotations
 from difflib import get_close_matches
+from functools import lru_cache
 import logging
 import os
 from typing import Iterable, Optional
@@ -80,10 +81,24 @@ def warn_bad_version(version: str, desc: str) -> None:
     If ``version`` is not :pep:`440`-compliant, log a warning.  ``desc`` is a
     description of the version's provenance.
     """
+    if not is_pep440_version(version):
+        log.warning("%s %r is not PEP 440-compliant", desc, version)
+
+
+@lru_cache(maxsize=128)
+def is_pep440_version(version: str) -> bool:
+    """
+    Test whether ``version`` is a valid :pep:`440` version.  Results are
+    cached, as the same version is typically checked several times per run.
+
+    :meta private:
+    """
     try:
         Version(version)
     except ValueError:
-        log.warning("%s %r is not PEP 440-compliant", desc, version)
+        return False
+    else:
+        return True
 
 
 def didyoumean(mistake: str, valid: Iterable[str]) -> str:
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import import_module
 import os.path
 from pathlib import Path
@@ -12,14 +13,63 @@ from .errors import ConfigError, MethodError
 from .logging import didyoumean, log
 
 if sys.version_info[:2] >= (3, 10):
-    from importlib.metadata import entry_points
+    from importlib.metadata import EntryPoints, entry_points
 else:
-    from importlib_metadata import entry_points
+    from importlib_metadata import EntryPoints, entry_points
 
 
-# Call `entry_points()` only once and save the results for a speedup.  See
-# <https://github.com/jwodder/versioningit/pull/7>.
-ENTRY_POINTS = entry_points()
+@lru_cache(maxsize=None)
+def get_entry_points() -> EntryPoints:
+    """
+    Return all installed entry points.  `entry_points()` is only called once,
+    the first time this is needed, and the results are saved for a speedup
+    (See <https://github.com/jwodder/versioningit/pull/7>); deferring the call
+    keeps the scan of installed distributions out of import time.
+
+    :meta private:
+    """
+    if sys.version_info[:2] >= (3, 10) and sys.version_info[:2] < (3, 12):
+        # On Python 3.10 and 3.11, `entry_points()` returns a deprecated
+        # `SelectableGroups` dict mapping group names to `EntryPoints`.
+        # Calling `dict.values()` directly avoids the deprecation warning.
+        groups: dict[str, EntryPoints] = entry_points()
+        return EntryPoints(ep for eps in dict.values(groups) for ep in eps)
+    else:
+        return entry_points()
+
+
+@lru_cache(maxsize=None)
+def load_entry_point(group: str, name: str) -> Callable:
+    """
+    Look up & load the entry point named ``name`` in ``group``.  Results are
+    cached, as the set of entry points (`get_entry_points()`) is fixed for the
+    life of the process.
+
+    :raises ConfigError: if no such entry point exists
+    :raises MethodError: if the loaded entry point is not a callable
+
+    :meta private:
+    """
+    all_eps = get_entry_points()
+    eps = list(all_eps.select(group=group, name=name))
+    if len(eps) == 0:
+        valid = [ep.name for ep in all_eps.select(group=group)]
+        raise ConfigError(
+            f"{group} entry point {name!r} not found{didyoumean(name, valid)}"
+        )
+    elif len(eps) > 1:
+        raise ConfigError(
+            "Packaging conflict!  Multiple entry points named"
+            f" {name!r} registered in group {group}"
+        )
+    else:
+        ep = eps[0]
+    c = ep.load()
+    if not callable(c):
+        raise MethodError(
+            f"{group} entry point {name!r} did not resolve to a callable object"
+        )
+    return cast(Callable, c)
 
 
 class MethodSpec(ABC):
@@ -58,27 +108,7 @@ class EntryPointSpec(MethodSpec):
         :raises MethodError: if the loaded entry point is not a callable
         """
         log.debug("Loading entry point %r in group %s", self.name, self.group)
-        eps = list(ENTRY_POINTS.select(group=self.group, name=self.name))
-        if len(eps) == 0:
-            valid = [ep.name for ep in ENTRY_POINTS.select(group=self.group)]
-            raise ConfigError(
-                f"{self.group} entry point {self.name!r} not"
-                f" found{didyoumean(self.name, valid)}"
-            )
-        elif len(eps) > 1:
-            raise ConfigError(
-                "Packaging conflict!  Multiple entry points named"
-                f" {self.name!r} registered in group {self.group}"
-            )
-        else:
-            ep = eps[0]
-        c = ep.load()
-        if not callable(c):
-            raise MethodError(
-                f"{self.group} entry point {self.name!r} did not resolve to a"
-                " callable object"
-            )
-        return cast(Callable, c)
+        return load_entry_point(self.group, self.name)
 
 
 @dataclass
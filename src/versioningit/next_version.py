@@ -1,23 +1,34 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 import re
 from typing import Any, Optional
 from packaging.version import Version
 from .errors import InvalidVersionError
 from .logging import warn_extra_fields
 
+BASIC_VERSION_RGX = re.compile(
+    r"v?(?:(?P<epoch>[0-9]+)!)?(?P<release>[0-9]+(?:\.[0-9]+)*)(?!!)"
+)
 
-@dataclass
+
+@dataclass(frozen=True)
 class BasicVersion:
-    """A version consisting of just an optional epoch and a release segment"""
+    """
+    A version consisting of just an optional epoch and a release segment.
+
+    Instances are immutable, as `parse()` returns cached instances for repeated
+    inputs.
+    """
 
     #: The epoch (Zero equals a lack of an explicit epoch)
     epoch: int
 
     #: The integer values of the components of the release segment
-    release: list[int]
+    release: tuple[int, ...]
 
     @classmethod
+    @lru_cache(maxsize=256)
     def parse(cls, version: str) -> BasicVersion:
         """
         Parse the initial epoch and release segment from a version string and
@@ -25,9 +36,7 @@ class BasicVersion:
 
         :raises InvalidVersionError: if ``version`` cannot be parsed
         """
-        m = re.match(
-            r"v?(?:(?P<epoch>[0-9]+)!)?(?P<release>[0-9]+(?:\.[0-9]+)*)(?!!)", version
-        )
+        m = BASIC_VERSION_RGX.match(version)
         if not m:
             raise InvalidVersionError(f"Cannot parse version {version!r}")
         sepoch = m["epoch"]
@@ -38,7 +47,7 @@ class BasicVersion:
             epoch = int(sepoch)
         release = m["release"]
         assert isinstance(release, str)
-        return cls(epoch, list(map(int, release.split("."))))
+        return cls(epoch, tuple(map(int, release.split("."))))
 
     def __str__(self) -> str:
         """Convert the `BasicVersion` to a string"""
@@ -58,10 +67,8 @@ def next_minor_version(
     """Implements the ``"minor"`` ``next-version`` method"""
     warn_extra_fields(params, "next-version")
     bv = BasicVersion.parse(version)
-    bv.release = (bv.release + [0, 0])[:2]
-    bv.release[1] += 1
-    bv.release.append(0)
-    return str(bv)
+    major, minor = (bv.release + (0, 0))[:2]
+    return str(replace(bv, release=(major, minor + 1, 0)))
 
 
 def next_smallest_version(
@@ -73,8 +80,7 @@ def next_smallest_version(
     """Implements the ``"smallest"`` ``next-version`` method"""
     warn_extra_fields(params, "next-version")
     bv = BasicVersion.parse(version)
-    bv.release[-1] += 1
-    return str(bv)
+    return str(replace(bv, release=bv.release[:-1] + (bv.release[-1] + 1,)))
 
 
 def null_next_version(
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from collections.abc import Sequence
-from datetime import datetime, timezone
-import json
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
 import os
 from pathlib import Path
 import re
@@ -12,6 +12,53 @@ from packaging.version import Version
 from .errors import ConfigError, InvalidVersionError
 from .logging import log
 
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+#: Regex matching a PEP 440 version in normalized form, i.e., one that is
+#: unchanged by round-tripping through `packaging.version.Version`
+CANONICAL_PEP440_RGX = re.compile(
+    r"(?:(?P<epoch>0|[1-9][0-9]*)!)?"
+    r"(?P<release>(?:0|[1-9][0-9]*)(?:\.(?:0|[1-9][0-9]*))*)"
+    r"(?P<pre>(?:a|b|rc)(?:0|[1-9][0-9]*))?"
+    r"(?:\.(?P<post>post(?:0|[1-9][0-9]*)))?"
+    r"(?:\.(?P<dev>dev(?:0|[1-9][0-9]*)))?"
+    r"(?:\+(?P<local>(?:[a-z0-9]*[a-z][a-z0-9]*|0|[1-9][0-9]*)"
+    r"(?:\.(?:[a-z0-9]*[a-z][a-z0-9]*|0|[1-9][0-9]*))*))?"
+)
+
+#: The characters that `str.splitlines()` treats as line boundaries
+LINE_TERMINATORS = (
+    "\n",
+    "\r",
+    "\v",
+    "\f",
+    "\x1C",
+    "\x1D",
+    "\x1E",
+    "\x85",
+    "\u2028",
+    "\u2029",
+)
+
+#: Translation table for `qqrepr()`, escaping the same characters as
+#: `json.dumps()` with ``ensure_ascii=False``
+QQREPR_ESCAPES = str.maketrans(
+    {
+        **{chr(i): f"\\u{i:04x}" for i in range(0x20)},
+        '"': '\\"',
+        "\\": "\\\\",
+        "\b": "\\b",
+        "\f": "\\f",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+    }
+)
+
+#: Regex matching the start of a :mailheader:`Version` header line in
+#: packaging metadata
+METADATA_VERSION_RGX = re.compile(r"Version\s*:\s*")
+
 
 def str_guard(v: Any, fieldname: str) -> str:
     """
@@ -41,7 +88,7 @@ def list_str_guard(v: Any, fieldname: str) -> list[str]:
     `ConfigError`.  ``fieldname`` is an identifier for ``v`` to include in the
     error message.
     """
-    if isinstance(v, list) and all(isinstance(e, str) for e in v):
+    if isinstance(v, list) and all(map(isinstance, v, repeat(str))):
         return v
     else:
         raise ConfigError(f"versioningit's {fieldname} must be a list of strings")
@@ -79,12 +126,15 @@ def get_build_date() -> datetime:
     :envvar:`SOURCE_DATE_EPOCH` is set, use that value instead (See
     <https://reproducible-builds.org/specs/source-date-epoch/>).
     """
-    try:
-        source_date_epoch = int(os.environ["SOURCE_DATE_EPOCH"])
-    except (KeyError, ValueError):
-        return datetime.now(timezone.utc)
-    else:
-        return fromtimestamp(source_date_epoch)
+    sde = os.environ.get("SOURCE_DATE_EPOCH")
+    if sde is not None:
+        try:
+            source_date_epoch = int(sde)
+        except ValueError:
+            pass
+        else:
+            return fromtimestamp(source_date_epoch)
+    return datetime.now(timezone.utc)
 
 
 def fromtimestamp(ts: int) -> datetime:
@@ -92,7 +142,10 @@ def fromtimestamp(ts: int) -> datetime:
     Convert an integer number of seconds since the epoch to an aware UTC
     `~datetime.datetime`
     """
-    return datetime.fromtimestamp(ts, tz=timezone.utc)
+    # Adding to the epoch is plain arithmetic, unlike datetime.fromtimestamp(),
+    # which goes through the C library's time conversion functions (and thus
+    # rejects negative timestamps on Windows).
+    return UNIX_EPOCH + timedelta(seconds=ts)
 
 
 def strip_prefix(s: str, prefix: str) -> str:
@@ -101,8 +154,7 @@ def strip_prefix(s: str, prefix: str) -> str:
     otherwise, return ``s`` unchanged.
     """
     # cf. str.removeprefix, introduced in Python 3.9
-    n = len(prefix)
-    return s[n:] if s[:n] == prefix else s
+    return s[len(prefix) :] if s.startswith(prefix) else s
 
 
 def strip_suffix(s: str, suffix: str) -> str:
@@ -111,8 +163,7 @@ def strip_suffix(s: str, suffix: str) -> str:
     otherwise, return ``s`` unchanged.
     """
     # cf. str.removesuffix, introduced in Python 3.9
-    n = len(suffix)
-    return s[:-n] if s[-n:] == suffix else s
+    return s[: len(s) - len(suffix)] if s.endswith(suffix) else s
 
 
 def parse_version_from_metadata(metadata: str) -> str:
@@ -123,9 +174,10 @@ def parse_version_from_metadata(metadata: str) -> str:
     :raises ValueError: if there is no :mailheader:`Version` field
     """
     for line in metadata.splitlines():
-        m = re.match(r"Version\s*:\s*", line)
-        if m:
-            return line[m.end() :].strip()
+        if line.startswith("Version"):
+            m = METADATA_VERSION_RGX.match(line)
+            if m:
+                return line[m.end() :].strip()
         elif not line:
             break
     raise ValueError("Metadata does not contain a Version field")
@@ -136,7 +188,7 @@ def showcmd(args: list) -> str:
     Stringify the elements of ``args``, shell-quote them, and join the results
     with a space
     """
-    return " ".join(shlex.quote(os.fsdecode(a)) for a in args)
+    return shlex.join(map(os.fsdecode, args))
 
 
 def is_sdist(project_dir: str | Path) -> bool:
@@ -167,23 +219,25 @@ def split_version(
 def split_pep440_version(
     v: str, double_quote: bool = True, epoch: Optional[bool] = None
 ) -> str:
-    try:
-        vobj = Version(v)
-    except ValueError:
-        raise InvalidVersionError(f"{v!r} is not a valid PEP 440 version")
+    m = CANONICAL_PEP440_RGX.fullmatch(v)
+    if m is None:
+        # Normalize the version (or reject it) and then split the result
+        try:
+            v = str(Version(v))
+        except ValueError:
+            raise InvalidVersionError(f"{v!r} is not a valid PEP 440 version")
+        m = CANONICAL_PEP440_RGX.fullmatch(v)
+        assert m is not None
     parts: list[str | int] = []
-    if epoch or (vobj.epoch and epoch is None):
-        parts.append(vobj.epoch)
-    parts.extend(vobj.release)
-    if vobj.pre is not None:
-        phase, num = vobj.pre
-        parts.append(f"{phase}{num}")
-    if vobj.post is not None:
-        parts.append(f"post{vobj.post}")
-    if vobj.dev is not None:
-        parts.append(f"dev{vobj.dev}")
-    if vobj.local is not None:
-        parts.append(f"+{vobj.local}")
+    vepoch = int(m["epoch"] or 0)
+    if epoch or (vepoch and epoch is None):
+        parts.append(vepoch)
+    parts.extend(map(int, m["release"].split(".")))
+    for segment in ("pre", "post", "dev"):
+        if m[segment] is not None:
+            parts.append(m[segment])
+    if m["local"] is not None:
+        parts.append("+" + m["local"])
     return repr_tuple(parts, double_quote)
 
 
@@ -201,13 +255,12 @@ def repr_tuple(parts: Sequence[str | int], double_quote: bool = True) -> str:
 
 def qqrepr(s: str) -> str:
     """Produce a repr(string) enclosed in double quotes"""
-    return json.dumps(s, ensure_ascii=False)
+    return '"' + s.translate(QQREPR_ESCAPES) + '"'
 
 
 def ensure_terminated(s: str) -> str:
     """Append a newline to ``s`` if it doesn't already end with one"""
-    lines = s.splitlines(keepends=True)
-    if not lines or lines[-1].splitlines() == [lines[-1]]:
-        return s + "\n"
-    else:
+    if s.endswith(LINE_TERMINATORS):
         return s
+    else:
+        return s + "\n"
@@ -1,7 +1,22 @@
 from __future__ import annotations
+from collections.abc import Callable
 import logging
+import os
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+from zipfile import ZipFile
 import pytest
 
+if sys.platform == "linux":
+    import fcntl
+
+    # From <linux/fs.h>
+    FICLONE = 0x40049409
+
+DATA_DIR = Path(__file__).with_name("data")
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -10,6 +25,37 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Run tests that require older setuptools",
     )
+    parser.addoption(
+        "--tmpfs",
+        action="store_true",
+        default=False,
+        help="Put pytest's base temporary directory in /dev/shm (Linux only)",
+    )
+
+
+TMPFS_BASETEMP = pytest.StashKey[str]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # pytest-xdist workers are handed a basetemp inside the controller's, so
+    # only the controller needs to pick one.
+    if (
+        config.getoption("--tmpfs")
+        and config.option.basetemp is None
+        and sys.platform == "linux"
+        and os.path.isdir("/dev/shm")
+    ):
+        basetemp = tempfile.mkdtemp(dir="/dev/shm", prefix="pytest-")
+        config.option.basetemp = basetemp
+        config.stash[TMPFS_BASETEMP] = basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    # Unlike pytest's usual temp directories, this one lives in RAM and is not
+    # pruned by later runs, so remove it when done.
+    basetemp = config.stash.get(TMPFS_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
 
 
 def pytest_collection_modifyitems(
@@ -31,3 +77,93 @@ def capture_all_logs(caplog: pytest.LogCaptureFixture) -> None:
 def source_date_epoch(monkeypatch: pytest.MonkeyPatch) -> None:
     # 2038-01-19T03:14:07Z
     monkeypatch.setenv("SOURCE_DATE_EPOCH", "2147483647")
+
+
+@pytest.fixture(scope="session")
+def clone_tree() -> Callable[[Path, Path], None]:
+    """
+    Returns a function for copying the directory tree at ``src`` to ``dest``
+    (which must not already exist) like `shutil.copytree()`, but cloning files
+    as copy-on-write reflinks where the filesystem supports it
+    """
+    return _clone_tree
+
+
+@pytest.fixture(scope="session")
+def unpacked_repo(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """
+    Returns a function that takes the path to an archive relative to
+    ``test/data/repos`` and returns the path to a directory into which the
+    archive has been unpacked.  Each archive is only unpacked once per session
+    (and, when running under pytest-xdist, once across all workers), so the
+    returned directory must not be modified.
+    """
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        # Each xdist worker gets its own basetemp inside a directory created
+        # afresh for the run by the controller, so use that directory to share
+        # unpacked archives between workers.
+        cache_dir = tmp_path_factory.getbasetemp().parent / "repos"
+        cache_dir.mkdir(exist_ok=True)
+    else:
+        cache_dir = tmp_path_factory.mktemp("repos")
+    cache: dict[str, Path] = {}
+
+    def get_repo(repo: str) -> Path:
+        try:
+            return cache[repo]
+        except KeyError:
+            path = cache_dir / Path(repo).with_suffix("")
+            if not path.exists():
+                # Unpack to a private directory and then move it into place so
+                # that other workers never see a partially-extracted tree
+                tmpdir = tmp_path_factory.mktemp("unpack")
+                with ZipFile(DATA_DIR / "repos" / repo) as zf:
+                    zf.extractall(tmpdir)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    tmpdir.rename(path)
+                except OSError:
+                    # Another worker got there first
+                    if not path.exists():
+                        raise
+            cache[repo] = path
+            return path
+
+    return get_repo
+
+
+@pytest.fixture
+def fresh_repo(
+    clone_tree: Callable[[Path, Path], None],
+    tmp_path: Path,
+    unpacked_repo: Callable[[str], Path],
+) -> Callable[[str], Path]:
+    """
+    Returns a function that takes the path to an archive relative to
+    ``test/data/repos`` and returns the path to a private copy of the unpacked
+    archive inside ``tmp_path`` that the test is free to modify
+    """
+
+    def get_repo(repo: str) -> Path:
+        path = tmp_path / Path(repo).stem
+        clone_tree(unpacked_repo(repo), path)
+        return path
+
+    return get_repo
+
+
+def _clone_tree(src: Path, dest: Path) -> None:
+    shutil.copytree(src, dest, copy_function=_clone_file)
+
+
+def _clone_file(src: str, dest: str) -> str:
+    if sys.platform == "linux":
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+                fcntl.ioctl(fdest.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dest)
+            return dest
+    return shutil.copy2(src, dest)
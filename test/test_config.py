@@ -6,7 +6,7 @@ import pytest
 from versioningit.config import Config, ConfigSection
 from versioningit.errors import ConfigError, NotVersioningitError
 from versioningit.git import describe_git
-from versioningit.methods import CallableSpec, EntryPointSpec
+from versioningit.methods import CallableSpec, EntryPointSpec, load_entry_point
 from versioningit.next_version import next_smallest_version
 
 DATA_DIR = Path(__file__).with_name("data")
@@ -24,6 +24,20 @@ def test_parse_toml_file(tomlfile: Path) -> None:
     assert cfg == namespace["cfg"]
 
 
+def test_parse_toml_file_cached(tmp_path: Path) -> None:
+    tomlfile = tmp_path / "pyproject.toml"
+    tomlfile.write_bytes((DATA_DIR / "config" / "hatch.toml").read_bytes())
+    cfg = Config.parse_toml_file(tomlfile)
+    assert Config.parse_toml_file(tomlfile) == cfg
+    tomlfile.write_text(
+        '[tool.versioningit]\ndefault-version = "0.0.0+changed"\n',
+        encoding="utf-8",
+    )
+    cfg2 = Config.parse_toml_file(tomlfile)
+    assert cfg2 != cfg
+    assert cfg2.default_version == "0.0.0+changed"
+
+
 @pytest.mark.parametrize(
     "tomlfile",
     sorted((DATA_DIR / "config-error").glob("*.toml")),
@@ -71,3 +85,17 @@ def test_parse_obj_callable_methods() -> None:
         write=None,
         onbuild=None,
     )
+
+
+def test_entry_point_spec_load_cached(tmp_path: Path) -> None:
+    load_entry_point.cache_clear()
+    spec = EntryPointSpec(group="versioningit.next_version", name="smallest")
+    assert spec.load(tmp_path) is next_smallest_version
+    assert spec.load(tmp_path) is next_smallest_version
+    assert load_entry_point.cache_info().hits == 1
+    with pytest.raises(ConfigError) as excinfo:
+        EntryPointSpec(group="versioningit.next_version", name="smalest").load(tmp_path)
+    assert str(excinfo.value) == (
+        "versioningit.next_version entry point 'smalest' not found"
+        " (Did you mean: smallest? smallest-release?)"
+    )
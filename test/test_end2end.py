@@ -1,5 +1,4 @@
 from __future__ import annotations
-from collections.abc import Iterator
 import logging
 import os
 from pathlib import Path
@@ -40,11 +39,14 @@ class File(BaseModel):
             return
         else:
             path = dirpath / self.wheel_path
+        # Compare encoded bytes rather than decoding the file; CRLFs are
+        # normalized so that the comparison also holds on Windows.
+        expected = self.contents.encode(self.encoding)
         if self.in_project or mode != "project":
-            assert path.read_text(encoding=self.encoding) == self.contents
+            assert path.read_bytes().replace(b"\r\n", b"\n") == expected
         else:
             try:
-                assert path.read_text(encoding=self.encoding) != self.contents
+                assert path.read_bytes().replace(b"\r\n", b"\n") != expected
             except FileNotFoundError:
                 pass
 
@@ -74,7 +76,8 @@ def mkcases(
     subdir: str,
     marks: list[pytest.MarkDecorator],
     details_cls: Type[BaseModel] = CaseDetails,
-) -> Iterator[ParameterSet]:
+) -> list[ParameterSet]:
+    cases = []
     for repozip in sorted((DATA_DIR / "repos" / subdir).glob("*.zip")):
         details = details_cls.model_validate_json(
             repozip.with_suffix(".json").read_text(encoding="utf-8")
@@ -85,27 +88,34 @@ def mkcases(
             )
         except FileNotFoundError:
             marknames = []
-        yield pytest.param(
-            repozip,
-            details,
-            marks=marks + [getattr(pytest.mark, m) for m in marknames],
-            id=f"{subdir}/{repozip.stem}",
+        cases.append(
+            pytest.param(
+                repozip,
+                details,
+                marks=marks + [getattr(pytest.mark, m) for m in marknames],
+                id=f"{subdir}/{repozip.stem}",
+            )
         )
+    return cases
 
 
-@pytest.mark.parametrize(
-    "repozip,details",
-    [
-        c
-        for subdir, marks in [
-            ("git", [needs_git]),
-            ("hatch", [needs_git]),
-            ("hg", [needs_hg]),
-            ("archives", cast(List[pytest.MarkDecorator], [])),
-        ]
-        for c in mkcases(subdir, marks)
-    ],
-)
+END2END_CASES = [
+    c
+    for subdir, marks in [
+        ("git", [needs_git]),
+        ("hatch", [needs_git]),
+        ("hg", [needs_hg]),
+        ("archives", cast(List[pytest.MarkDecorator], [])),
+    ]
+    for c in mkcases(subdir, marks)
+]
+
+GIT_ERROR_CASES = mkcases("git-errors", [needs_git], details_cls=ErrorDetails)
+
+HG_ERROR_CASES = mkcases("hg-errors", [needs_hg], details_cls=ErrorDetails)
+
+
+@pytest.mark.parametrize("repozip,details", END2END_CASES)
 def test_end2end(
     caplog: pytest.LogCaptureFixture,
     repozip: Path,
@@ -239,9 +249,7 @@ def test_get_version_config_only(
     )
 
 
-@pytest.mark.parametrize(
-    "repozip,details", mkcases("git-errors", [needs_git], details_cls=ErrorDetails)
-)
+@pytest.mark.parametrize("repozip,details", GIT_ERROR_CASES)
 def test_end2end_git_error(
     tmp_path: Path, repozip: Path, details: ErrorDetails
 ) -> None:
@@ -251,20 +259,17 @@ def test_end2end_git_error(
     assert type(excinfo.value).__name__ == details.type
     assert str(excinfo.value) == details.message
     r = subprocess.run(
-        [sys.executable, "-m", "build", "--no-isolation", str(tmp_path)],
+        [sys.executable, "-m", "build", "--no-isolation", tmp_path],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
     )
     assert r.returncode != 0
     out = r.stdout
-    assert isinstance(out, str)
     assert details.message in out
 
 
-@pytest.mark.parametrize(
-    "repozip,details", mkcases("hg-errors", [needs_hg], details_cls=ErrorDetails)
-)
+@pytest.mark.parametrize("repozip,details", HG_ERROR_CASES)
 def test_end2end_hg_error(tmp_path: Path, repozip: Path, details: ErrorDetails) -> None:
     shutil.unpack_archive(repozip, tmp_path)
     with pytest.raises(Error) as excinfo:
@@ -272,14 +277,13 @@ def test_end2end_hg_error(tmp_path: Path, repozip: Path, details: ErrorDetails)
     assert type(excinfo.value).__name__ == details.type
     assert str(excinfo.value) == details.message
     r = subprocess.run(
-        [sys.executable, "-m", "build", "--no-isolation", str(tmp_path)],
+        [sys.executable, "-m", "build", "--no-isolation", tmp_path],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
     )
     assert r.returncode != 0
     out = r.stdout
-    assert isinstance(out, str)
     assert details.message in out
 
 
@@ -288,14 +292,13 @@ def test_end2end_hg_error(tmp_path: Path, repozip: Path, details: ErrorDetails)
 def test_end2end_version_not_found(tmp_path: Path, zipname: str) -> None:
     shutil.unpack_archive(DATA_DIR / "repos" / zipname, tmp_path)
     r = subprocess.run(
-        [sys.executable, "-m", "build", "--no-isolation", str(tmp_path)],
+        [sys.executable, "-m", "build", "--no-isolation", tmp_path],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
     )
     assert r.returncode != 0
     out = r.stdout
-    assert isinstance(out, str)
     assert (
         "\nversioningit could not find a version for the project in"
         f" {tmp_path}!\n\n"
@@ -379,6 +382,7 @@ def test_build_wheel_directly(repopath: str, tmp_path: Path) -> None:
 
 
 @needs_git
+@pytest.mark.xdist_group(name="pip-install")
 @pytest.mark.parametrize(
     "cmd",
     [
@@ -394,7 +398,7 @@ def test_editable_mode(cmd: list[str], tmp_path: Path) -> None:
     srcdir = tmp_path / "src"
     shutil.unpack_archive(repozip, srcdir)
     status = get_repo_status(srcdir)
-    subprocess.run([sys.executable, *cmd], cwd=str(srcdir), check=True)
+    subprocess.run([sys.executable, *cmd], cwd=srcdir, check=True)
     try:
         assert get_repo_status(srcdir) == status
         info = readcmd(sys.executable, "-m", "pip", "show", "mypackage")
@@ -412,6 +416,7 @@ def test_editable_mode(cmd: list[str], tmp_path: Path) -> None:
 
 
 @needs_git
+@pytest.mark.xdist_group(name="pip-install")
 def test_editable_mode_hatch(tmp_path: Path) -> None:
     repozip = DATA_DIR / "repos" / "hatch" / "onbuild-fields.zip"
     details = CaseDetails.model_validate_json(
@@ -422,7 +427,7 @@ def test_editable_mode_hatch(tmp_path: Path) -> None:
     status = get_repo_status(srcdir)
     subprocess.run(
         [sys.executable, "-m", "pip", "install", "--no-build-isolation", "-e", "."],
-        cwd=str(srcdir),
+        cwd=srcdir,
         check=True,
     )
     try:
@@ -453,7 +458,7 @@ def test_setup_py(tmp_path: Path) -> None:
 
     subprocess.run(
         [sys.executable, "setup.py", "sdist", "bdist_wheel"],
-        cwd=str(srcdir),
+        cwd=srcdir,
         check=True,
         env={**os.environ, "VERSIONINGIT_LOG_LEVEL": "DEBUG"},
     )
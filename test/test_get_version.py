@@ -1,13 +1,15 @@
 from pathlib import Path
 import shutil
 import pytest
-from versioningit.core import get_version
+from versioningit.core import get_version, get_version_from_pkg_info
 from versioningit.errors import NotSdistError, NotVCSError
 
 DATA_DIR = Path(__file__).with_name("data")
 
+needs_git = pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
 
-@pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
+
+@needs_git
 def test_get_version_no_git_fallback(tmp_path: Path) -> None:
     shutil.unpack_archive(DATA_DIR / "repos" / "no-git.zip", tmp_path)
     with pytest.raises(NotSdistError) as excinfo:
@@ -15,9 +17,42 @@ def test_get_version_no_git_fallback(tmp_path: Path) -> None:
     assert str(excinfo.value) == f"{tmp_path} does not contain a PKG-INFO file"
 
 
-@pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
+@needs_git
 def test_get_version_no_git_no_fallback(tmp_path: Path) -> None:
     shutil.unpack_archive(DATA_DIR / "repos" / "no-git.zip", tmp_path)
     with pytest.raises(NotVCSError) as excinfo:
         get_version(project_dir=tmp_path, write=False, fallback=False)
     assert str(excinfo.value) == f"{tmp_path} is not in a Git repository"
+
+
+def test_get_version_from_pkg_info(tmp_path: Path) -> None:
+    (tmp_path / "PKG-INFO").write_bytes(
+        b"Metadata-Version: 2.1\n"
+        b"Name: foobar\n"
+        b"Version: 1.2.3\n"
+        b"\n"
+        b"Version: 4.5.6\n"
+        b"\xff\xfe Not UTF-8\n"
+    )
+    assert get_version_from_pkg_info(tmp_path) == "1.2.3"
+
+
+def test_get_version_from_pkg_info_crlf(tmp_path: Path) -> None:
+    (tmp_path / "PKG-INFO").write_bytes(
+        b"Metadata-Version: 2.1\r\n"
+        b"Name: foobar\r\n"
+        b"Version: 1.2.3\r\n"
+        b"\r\n"
+        b"Version: 4.5.6\r\n"
+        b"\xff\xfe Not UTF-8\r\n"
+    )
+    assert get_version_from_pkg_info(tmp_path) == "1.2.3"
+
+
+def test_get_version_from_pkg_info_no_version(tmp_path: Path) -> None:
+    (tmp_path / "PKG-INFO").write_bytes(
+        b"Metadata-Version: 2.1\nName: foobar\n\nVersion: 4.5.6\n"
+    )
+    with pytest.raises(ValueError) as excinfo:
+        get_version_from_pkg_info(tmp_path)
+    assert str(excinfo.value) == "Metadata does not contain a Version field"
@@ -1,39 +1,56 @@
 import logging
 import pytest
-from versioningit.logging import parse_log_level, warn_bad_version, warn_extra_fields
-
-
-@pytest.mark.parametrize(
-    "name,level",
-    [
-        ("CRITICAL", logging.CRITICAL),
-        ("critical", logging.CRITICAL),
-        ("cRiTiCaL", logging.CRITICAL),
-        (str(logging.CRITICAL), logging.CRITICAL),
-        ("ERROR", logging.ERROR),
-        ("error", logging.ERROR),
-        ("ErRoR", logging.ERROR),
-        (str(logging.ERROR), logging.ERROR),
-        ("WARNING", logging.WARNING),
-        ("warning", logging.WARNING),
-        ("WaRnInG", logging.WARNING),
-        (str(logging.WARNING), logging.WARNING),
-        ("INFO", logging.INFO),
-        ("info", logging.INFO),
-        ("iNfO", logging.INFO),
-        (str(logging.INFO), logging.INFO),
-        ("DEBUG", logging.DEBUG),
-        ("debug", logging.DEBUG),
-        ("dEbUg", logging.DEBUG),
-        (str(logging.DEBUG), logging.DEBUG),
-        ("NOTSET", logging.NOTSET),
-        ("notset", logging.NOTSET),
-        ("NoTsEt", logging.NOTSET),
-        (str(logging.NOTSET), logging.NOTSET),
-        ("42", 42),
-        (" 42 ", 42),
-    ],
+from versioningit.logging import (
+    is_pep440_version,
+    parse_log_level,
+    warn_bad_version,
+    warn_extra_fields,
 )
+
+LEVEL_CASES = [
+    ("CRITICAL", logging.CRITICAL),
+    ("critical", logging.CRITICAL),
+    ("cRiTiCaL", logging.CRITICAL),
+    (str(logging.CRITICAL), logging.CRITICAL),
+    ("ERROR", logging.ERROR),
+    ("error", logging.ERROR),
+    ("ErRoR", logging.ERROR),
+    (str(logging.ERROR), logging.ERROR),
+    ("WARNING", logging.WARNING),
+    ("warning", logging.WARNING),
+    ("WaRnInG", logging.WARNING),
+    (str(logging.WARNING), logging.WARNING),
+    ("INFO", logging.INFO),
+    ("info", logging.INFO),
+    ("iNfO", logging.INFO),
+    (str(logging.INFO), logging.INFO),
+    ("DEBUG", logging.DEBUG),
+    ("debug", logging.DEBUG),
+    ("dEbUg", logging.DEBUG),
+    (str(logging.DEBUG), logging.DEBUG),
+    ("NOTSET", logging.NOTSET),
+    ("notset", logging.NOTSET),
+    ("NoTsEt", logging.NOTSET),
+    (str(logging.NOTSET), logging.NOTSET),
+    ("42", 42),
+    (" 42 ", 42),
+]
+
+GOOD_VERSIONS = ["0.1.0", "0.1.0a", "01.02.03", "v0.1.0"]
+
+BAD_VERSIONS = [
+    "",
+    "0.1.",
+    "1!",
+    "0.1.0j",
+    "0.1.0-extra",
+    "rel-0.1.0",
+    "1!v1.2.3",
+    "1!2!3",
+]
+
+
+@pytest.mark.parametrize("name,level", LEVEL_CASES)
 def test_parse_log_level(name: str, level: int) -> None:
     assert parse_log_level(name) == level
 
@@ -69,25 +86,13 @@ def test_warn_extra_fields_some(caplog: pytest.LogCaptureFixture) -> None:
     ]
 
 
-@pytest.mark.parametrize("v", ["0.1.0", "0.1.0a", "01.02.03", "v0.1.0"])
+@pytest.mark.parametrize("v", GOOD_VERSIONS)
 def test_warn_bad_version_good(caplog: pytest.LogCaptureFixture, v: str) -> None:
     warn_bad_version(v, "test")
     assert caplog.record_tuples == []
 
 
-@pytest.mark.parametrize(
-    "v",
-    [
-        "",
-        "0.1.",
-        "1!",
-        "0.1.0j",
-        "0.1.0-extra",
-        "rel-0.1.0",
-        "1!v1.2.3",
-        "1!2!3",
-    ],
-)
+@pytest.mark.parametrize("v", BAD_VERSIONS)
 def test_warn_bad_version_bad(caplog: pytest.LogCaptureFixture, v: str) -> None:
     warn_bad_version(v, "Test version")
     assert caplog.record_tuples == [
@@ -97,3 +102,21 @@ def test_warn_bad_version_bad(caplog: pytest.LogCaptureFixture, v: str) -> None:
             f"Test version {v!r} is not PEP 440-compliant",
         )
     ]
+
+
+def test_warn_bad_version_repeated(caplog: pytest.LogCaptureFixture) -> None:
+    is_pep440_version.cache_clear()
+    warn_bad_version("1.2.3-foo", "Test version")
+    warn_bad_version("1.2.3-foo", "Test version")
+    assert (
+        caplog.record_tuples
+        == [
+            (
+                "versioningit",
+                logging.WARNING,
+                "Test version '1.2.3-foo' is not PEP 440-compliant",
+            )
+        ]
+        * 2
+    )
+    assert is_pep440_version.cache_info().hits == 1
@@ -4,22 +4,34 @@ from pathlib import Path
 import subprocess
 import sys
 from typing import Any, Optional
+from unittest.mock import MagicMock
 import pytest
 from pytest_mock import MockerFixture
 from versioningit.__main__ import main
 from versioningit.errors import Error
 
 
+@pytest.fixture(autouse=True)
+def patched_get_version(mocker: MockerFixture) -> MagicMock:
+    """
+    Patch out `versioningit.__main__.get_version` with a mock that returns
+    ``"THE VERSION"``
+    """
+    m = mocker.patch("versioningit.__main__.get_version", return_value="THE VERSION")
+    assert isinstance(m, MagicMock)
+    return m
+
+
 def test_command(
     capsys: pytest.CaptureFixture[str],
     mocker: MockerFixture,
+    patched_get_version: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(sys, "argv", ["versioningit"])
-    m = mocker.patch("versioningit.__main__.get_version", return_value="THE VERSION")
     spy = mocker.spy(logging, "basicConfig")
     main()
-    m.assert_called_once_with(os.curdir, write=False, fallback=True)
+    patched_get_version.assert_called_once_with(os.curdir, write=False, fallback=True)
     spy.assert_called_once_with(
         format="[%(levelname)-8s] %(name)s: %(message)s",
         level=logging.WARNING,
@@ -30,22 +42,34 @@ def test_command(
 
 
 def test_command_arg(
-    capsys: pytest.CaptureFixture[str], mocker: MockerFixture, tmp_path: Path
+    capsys: pytest.CaptureFixture[str], patched_get_version: MagicMock, tmp_path: Path
 ) -> None:
-    m = mocker.patch("versioningit.__main__.get_version", return_value="THE VERSION")
     main([str(tmp_path)])
-    m.assert_called_once_with(str(tmp_path), write=False, fallback=True)
+    patched_get_version.assert_called_once_with(
+        str(tmp_path), write=False, fallback=True
+    )
     out, err = capsys.readouterr()
     assert out == "THE VERSION\n"
     assert err == ""
 
 
+def test_command_extra_args(
+    capsys: pytest.CaptureFixture[str], patched_get_version: MagicMock
+) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["foo", "bar"])
+    assert excinfo.value.args == (2,)
+    patched_get_version.assert_not_called()
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "unrecognized arguments: bar" in err
+
+
 def test_command_write(
-    capsys: pytest.CaptureFixture[str], mocker: MockerFixture
+    capsys: pytest.CaptureFixture[str], patched_get_version: MagicMock
 ) -> None:
-    m = mocker.patch("versioningit.__main__.get_version", return_value="THE VERSION")
     main(["--write"])
-    m.assert_called_once_with(os.curdir, write=True, fallback=True)
+    patched_get_version.assert_called_once_with(os.curdir, write=True, fallback=True)
     out, err = capsys.readouterr()
     assert out == "THE VERSION\n"
     assert err == ""
@@ -99,6 +123,7 @@ def test_command_next_version_arg(
 def test_command_verbose(
     capsys: pytest.CaptureFixture[str],
     mocker: MockerFixture,
+    patched_get_version: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
     arg: Optional[str],
     logenv: Optional[str],
@@ -108,10 +133,9 @@ def test_command_verbose(
         monkeypatch.delenv("VERSIONINGIT_LOG_LEVEL", raising=False)
     else:
         monkeypatch.setenv("VERSIONINGIT_LOG_LEVEL", logenv)
-    m = mocker.patch("versioningit.__main__.get_version", return_value="THE VERSION")
     spy = mocker.spy(logging, "basicConfig")
     main([arg] if arg is not None else [])
-    m.assert_called_once_with(os.curdir, write=False, fallback=True)
+    patched_get_version.assert_called_once_with(os.curdir, write=False, fallback=True)
     spy.assert_called_once_with(
         format="[%(levelname)-8s] %(name)s: %(message)s",
         level=log_level,
@@ -123,17 +147,15 @@ def test_command_verbose(
 
 def test_command_error(
     capsys: pytest.CaptureFixture[str],
-    mocker: MockerFixture,
+    patched_get_version: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(sys, "argv", ["versioningit"])
-    m = mocker.patch(
-        "versioningit.__main__.get_version", side_effect=Error("Something broke")
-    )
+    patched_get_version.side_effect = Error("Something broke")
     with pytest.raises(SystemExit) as excinfo:
         main()
     assert excinfo.value.args == (1,)
-    m.assert_called_once_with(os.curdir, write=False, fallback=True)
+    patched_get_version.assert_called_once_with(os.curdir, write=False, fallback=True)
     out, err = capsys.readouterr()
     assert out == ""
     assert err == "versioningit: Error: Something broke\n"
@@ -153,22 +175,19 @@ def test_command_error(
 def test_command_subprocess_error(
     caplog: pytest.LogCaptureFixture,
     capsys: pytest.CaptureFixture[str],
-    mocker: MockerFixture,
+    patched_get_version: MagicMock,
     monkeypatch: pytest.MonkeyPatch,
     argv: Any,
     cmd: str,
 ) -> None:
     monkeypatch.setattr(sys, "argv", ["versioningit"])
-    m = mocker.patch(
-        "versioningit.__main__.get_version",
-        side_effect=subprocess.CalledProcessError(
-            returncode=42, cmd=argv, output=b"", stderr=b""
-        ),
+    patched_get_version.side_effect = subprocess.CalledProcessError(
+        returncode=42, cmd=argv, output=b"", stderr=b""
     )
     with pytest.raises(SystemExit) as excinfo:
         main()
     assert excinfo.value.args == (42,)
-    m.assert_called_once_with(os.curdir, write=False, fallback=True)
+    patched_get_version.assert_called_once_with(os.curdir, write=False, fallback=True)
     out, err = capsys.readouterr()
     assert out == ""
     assert err == ""
@@ -8,131 +8,98 @@ from versioningit.errors import ConfigError
 
 BUILD_DATE = datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc)
 
+BASE_FIELDS = {"distance": 5, "vcs": "g", "rev": "abcdef0", "build_date": BUILD_DATE}
 
-@pytest.mark.parametrize(
-    "description,base_version,next_version,params,r",
-    [
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="distance",
-                branch="main",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {},
-            "0.1.0.post5+gabcdef0",
+
+FORMAT_CASES = [
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="distance",
+            branch="main",
+            fields=BASE_FIELDS,
         ),
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="dirty",
-                branch="main",
-                fields={
-                    "distance": 0,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {},
-            "0.1.0+d20380119",
+        "0.1.0",
+        "0.2.0",
+        {},
+        "0.1.0.post5+gabcdef0",
+    ),
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="dirty",
+            branch="main",
+            fields={**BASE_FIELDS, "distance": 0},
         ),
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="distance-dirty",
-                branch="main",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {},
-            "0.1.0.post5+gabcdef0.d20380119",
+        "0.1.0",
+        "0.2.0",
+        {},
+        "0.1.0+d20380119",
+    ),
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="distance-dirty",
+            branch="main",
+            fields=BASE_FIELDS,
         ),
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="distance",
-                branch="main",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {"distance": "{next_version}.dev{distance}+{vcs}{rev}"},
-            "0.2.0.dev5+gabcdef0",
+        "0.1.0",
+        "0.2.0",
+        {},
+        "0.1.0.post5+gabcdef0.d20380119",
+    ),
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="distance",
+            branch="main",
+            fields=BASE_FIELDS,
         ),
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="distance",
-                branch="feature/acme",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {"distance": "{next_version}+{branch}.{rev}"},
-            "0.2.0+feature.acme.abcdef0",
+        "0.1.0",
+        "0.2.0",
+        {"distance": "{next_version}.dev{distance}+{vcs}{rev}"},
+        "0.2.0.dev5+gabcdef0",
+    ),
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="distance",
+            branch="feature/acme",
+            fields=BASE_FIELDS,
         ),
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="distance",
-                branch=None,
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {"distance": "{next_version}+{branch}.{rev}"},
-            "0.2.0+None.abcdef0",
+        "0.1.0",
+        "0.2.0",
+        {"distance": "{next_version}+{branch}.{rev}"},
+        "0.2.0+feature.acme.abcdef0",
+    ),
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="distance",
+            branch=None,
+            fields=BASE_FIELDS,
         ),
-        (
-            VCSDescription(
-                tag="v0.1.0",
-                state="weird",
-                branch="main",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
-            ),
-            "0.1.0",
-            "0.2.0",
-            {"weird": "{base_version}+{branch}.{build_date:%Y.%m.%d}"},
-            "0.1.0+main.2038.01.19",
+        "0.1.0",
+        "0.2.0",
+        {"distance": "{next_version}+{branch}.{rev}"},
+        "0.2.0+None.abcdef0",
+    ),
+    (
+        VCSDescription(
+            tag="v0.1.0",
+            state="weird",
+            branch="main",
+            fields=BASE_FIELDS,
         ),
-    ],
-)
+        "0.1.0",
+        "0.2.0",
+        {"weird": "{base_version}+{branch}.{build_date:%Y.%m.%d}"},
+        "0.1.0+main.2038.01.19",
+    ),
+]
+
+
+@pytest.mark.parametrize("description,base_version,next_version,params,r", FORMAT_CASES)
 def test_basic_format(
     caplog: pytest.LogCaptureFixture,
     description: VCSDescription,
@@ -160,12 +127,7 @@ def test_basic_format_invalid_state(caplog: pytest.LogCaptureFixture) -> None:
                 tag="v0.1.0",
                 state="weird",
                 branch="main",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
+                fields=BASE_FIELDS,
             ),
             base_version="0.1.0",
             next_version="0.2.0",
@@ -184,12 +146,7 @@ def test_basic_format_invalid_param_style(caplog: pytest.LogCaptureFixture) -> N
                 tag="v0.1.0",
                 state="dirty",
                 branch="main",
-                fields={
-                    "distance": 5,
-                    "vcs": "g",
-                    "rev": "abcdef0",
-                    "build_date": BUILD_DATE,
-                },
+                fields=BASE_FIELDS,
             ),
             base_version="0.1.0",
             next_version="0.2.0",
@@ -1,9 +1,9 @@
 from __future__ import annotations
+from collections.abc import Callable
 from datetime import datetime, timezone
-import json
+from functools import lru_cache
 import logging
 from pathlib import Path
-import re
 import shutil
 import subprocess
 from typing import Any
@@ -13,7 +13,9 @@ from versioningit.core import VCSDescription
 from versioningit.errors import ConfigError, NoTagError, NotVCSError
 from versioningit.git import GitRepo, describe_git, describe_git_archive
 
-needs_git = pytest.mark.skipif(shutil.which("git") is None, reason="Git not installed")
+HAS_GIT = shutil.which("git") is not None
+
+needs_git = pytest.mark.skipif(not HAS_GIT, reason="Git not installed")
 
 BUILD_DATE = datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc)
 
@@ -31,56 +33,75 @@ class GitFields(BaseModel):
     vcs_name: str
 
 
+@lru_cache(maxsize=None)
+def get_git_fields(name: str) -> dict[str, Any]:
+    """
+    Load & validate the expected fields for the Git test repository ``name``.
+    The result is cached and so must not be modified.
+    """
+    path = DATA_DIR / "repos" / "git" / f"{name}.fields.json"
+    return GitFields.model_validate_json(path.read_bytes()).model_dump()
+
+
+@pytest.fixture(scope="session")
+def empty_git_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Returns the path to a freshly-initialized Git repository with no commits.
+    The repository is shared across the session and must not be modified.
+    """
+    path = tmp_path_factory.mktemp("git-empty")
+    subprocess.run(["git", "init"], check=True, cwd=path)
+    return path
+
+
+DESCRIBE_GIT_CASES = [
+    ("exact", {}, "v0.1.0", "exact", "main"),
+    ("distance", {}, "v0.1.0", "distance", "main"),
+    ("distance-dirty", {}, "v0.1.0", "distance-dirty", "main"),
+    ("default-tag", {"default-tag": "v0.0.0"}, "v0.0.0", "distance", "main"),
+    ("match", {"match": ["v*"]}, "v0.1.0", "distance", "main"),
+    pytest.param(
+        "exclude",
+        {"exclude": ["v*"]},
+        "0.1.0",
+        "distance",
+        "main",
+        marks=pytest.mark.describe_exclude,
+    ),
+    ("detached-exact", {}, "v0.1.0", "exact", None),
+]
+
+GIT_ARCHIVE_FIELDS = {"build_date": BUILD_DATE, "vcs": "g", "vcs_name": "git"}
+
+
 @needs_git
-@pytest.mark.parametrize(
-    "repo,params,tag,state,branch",
-    [
-        ("exact", {}, "v0.1.0", "exact", "main"),
-        ("distance", {}, "v0.1.0", "distance", "main"),
-        ("distance-dirty", {}, "v0.1.0", "distance-dirty", "main"),
-        ("default-tag", {"default-tag": "v0.0.0"}, "v0.0.0", "distance", "main"),
-        ("match", {"match": ["v*"]}, "v0.1.0", "distance", "main"),
-        pytest.param(
-            "exclude",
-            {"exclude": ["v*"]},
-            "0.1.0",
-            "distance",
-            "main",
-            marks=pytest.mark.describe_exclude,
-        ),
-        ("detached-exact", {}, "v0.1.0", "exact", None),
-    ],
-)
+@pytest.mark.parametrize("repo,params,tag,state,branch", DESCRIBE_GIT_CASES)
 def test_describe_git(
     repo: str,
     params: dict[str, Any],
     tag: str,
     state: str,
     branch: str | None,
-    tmp_path: Path,
+    fresh_repo: Callable[[str], Path],
 ) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / f"{repo}.zip", tmp_path)
-    with (DATA_DIR / "repos" / "git" / f"{repo}.fields.json").open(
-        encoding="utf-8"
-    ) as fp:
-        fields = GitFields.model_validate(json.load(fp))
+    repo_dir = fresh_repo(f"git/{repo}.zip")
     description = VCSDescription(
         tag=tag,
         state=state,
         branch=branch,
-        fields=fields.model_dump(),
+        fields=get_git_fields(repo),
     )
-    desc = describe_git(project_dir=tmp_path, params=params)
+    desc = describe_git(project_dir=repo_dir, params=params)
     assert desc == description
     for date in ["author_date", "committer_date", "build_date"]:
         assert desc.fields[date].tzinfo is timezone.utc
 
 
 @needs_git
-def test_describe_git_no_tag(tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "default-tag.zip", tmp_path)
+def test_describe_git_no_tag(fresh_repo: Callable[[str], Path]) -> None:
+    repo_dir = fresh_repo("git/default-tag.zip")
     with pytest.raises(NoTagError) as excinfo:
-        describe_git(project_dir=tmp_path, params={})
+        describe_git(project_dir=repo_dir, params={})
     assert (
         str(excinfo.value)
         == "`git describe --long --dirty --always --tags` could not find a tag"
@@ -96,43 +117,45 @@ def test_describe_git_no_repo(tmp_path: Path) -> None:
 
 @needs_git
 @pytest.mark.parametrize("params", [{}, {"default-tag": "0.0.0"}])
-def test_describe_git_no_commits(tmp_path: Path, params: dict[str, Any]) -> None:
-    subprocess.run(["git", "init"], check=True, cwd=str(tmp_path))
+def test_describe_git_no_commits(
+    clone_tree: Callable[[Path, Path], None],
+    empty_git_repo: Path,
+    tmp_path: Path,
+    params: dict[str, Any],
+) -> None:
+    tmp_path /= "repo"
+    clone_tree(empty_git_repo, tmp_path)
     with pytest.raises(NotVCSError) as excinfo:
         describe_git(project_dir=tmp_path, params=params)
     assert str(excinfo.value) == f"{tmp_path} is not tracked by Git"
 
 
 @needs_git
-def test_describe_git_added_no_commits(tmp_path: Path) -> None:
-    shutil.unpack_archive(
-        DATA_DIR / "repos" / "git" / "added-no-commits-default-tag.zip", tmp_path
-    )
+def test_describe_git_added_no_commits(fresh_repo: Callable[[str], Path]) -> None:
+    repo_dir = fresh_repo("git/added-no-commits-default-tag.zip")
     with pytest.raises(
         NoTagError,
         match=r"^`git describe --long --dirty --always --tags` command failed: ",
     ):
-        describe_git(project_dir=tmp_path, params={})
+        describe_git(project_dir=repo_dir, params={})
 
 
 @needs_git
 def test_describe_git_no_clamp_dates(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, fresh_repo: Callable[[str], Path]
 ) -> None:
     monkeypatch.setenv("SOURCE_DATE_EPOCH", "1234567890")
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "exact.zip", tmp_path)
-    with (DATA_DIR / "repos" / "git" / "exact.fields.json").open(
-        encoding="utf-8"
-    ) as fp:
-        fields = GitFields.model_validate(json.load(fp))
-    fields.build_date = datetime(2009, 2, 13, 23, 31, 30, tzinfo=timezone.utc)
+    repo_dir = fresh_repo("git/exact.zip")
     description = VCSDescription(
         tag="v0.1.0",
         state="exact",
         branch="main",
-        fields=fields.model_dump(),
+        fields={
+            **get_git_fields("exact"),
+            "build_date": datetime(2009, 2, 13, 23, 31, 30, tzinfo=timezone.utc),
+        },
     )
-    assert describe_git(project_dir=tmp_path, params={}) == description
+    assert describe_git(project_dir=repo_dir, params={}) == description
 
 
 def test_describe_git_archive_no_describe_subst(tmp_path: Path) -> None:
@@ -154,10 +177,14 @@ def test_describe_git_archive_empty_describe_subst(tmp_path: Path) -> None:
 
 @pytest.mark.parametrize("init", [False, pytest.param(True, marks=needs_git)])
 def test_describe_git_archive_unexpanded_describe_subst(
-    init: bool, tmp_path: Path
+    clone_tree: Callable[[Path, Path], None],
+    init: bool,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
 ) -> None:
     if init:
-        subprocess.run(["git", "init"], check=True, cwd=str(tmp_path))
+        tmp_path /= "repo"
+        clone_tree(request.getfixturevalue("empty_git_repo"), tmp_path)
     with pytest.raises(NoTagError) as excinfo:
         describe_git_archive(
             project_dir=tmp_path, params={"describe-subst": "$Format:%(describe)$"}
@@ -170,10 +197,15 @@ def test_describe_git_archive_unexpanded_describe_subst(
 @pytest.mark.parametrize("init", [False, pytest.param(True, marks=needs_git)])
 @pytest.mark.parametrize("describe_subst", ["%(describe)", "%(describe:unknown=value)"])
 def test_describe_git_archive_bad_expanded_describe_subst(
-    init: bool, describe_subst: str, tmp_path: Path
+    clone_tree: Callable[[Path, Path], None],
+    init: bool,
+    describe_subst: str,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
 ) -> None:
     if init:
-        subprocess.run(["git", "init"], check=True, cwd=str(tmp_path))
+        tmp_path /= "repo"
+        clone_tree(request.getfixturevalue("empty_git_repo"), tmp_path)
     with pytest.raises(NoTagError) as excinfo:
         describe_git_archive(
             project_dir=tmp_path, params={"describe-subst": describe_subst}
@@ -184,10 +216,12 @@ def test_describe_git_archive_bad_expanded_describe_subst(
     )
 
 
-def test_describe_git_archive_repo_unset_describe_subst(tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "exact-annotated.zip", tmp_path)
+def test_describe_git_archive_repo_unset_describe_subst(
+    fresh_repo: Callable[[str], Path]
+) -> None:
+    repo_dir = fresh_repo("git/exact-annotated.zip")
     with pytest.raises(ConfigError) as excinfo:
-        describe_git_archive(project_dir=tmp_path, params={})
+        describe_git_archive(project_dir=repo_dir, params={})
     assert (
         str(excinfo.value)
         == "versioningit's vcs.describe-subst must be set to a string"
@@ -195,11 +229,13 @@ def test_describe_git_archive_repo_unset_describe_subst(tmp_path: Path) -> None:
 
 
 @needs_git
-def test_describe_git_archive_repo_bad_describe_subst(tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "exact-annotated.zip", tmp_path)
+def test_describe_git_archive_repo_bad_describe_subst(
+    fresh_repo: Callable[[str], Path]
+) -> None:
+    repo_dir = fresh_repo("git/exact-annotated.zip")
     with pytest.raises(ConfigError) as excinfo:
         describe_git_archive(
-            project_dir=tmp_path, params={"describe-subst": "%(describe)"}
+            project_dir=repo_dir, params={"describe-subst": "%(describe)"}
         )
     assert str(excinfo.value) == (
         "versioningit: Invalid vcs.describe-subst value: Expected string in"
@@ -209,45 +245,40 @@ def test_describe_git_archive_repo_bad_describe_subst(tmp_path: Path) -> None:
 
 @needs_git
 def test_describe_git_archive_added_no_commits_default_tag(
-    caplog: pytest.LogCaptureFixture, tmp_path: Path
+    caplog: pytest.LogCaptureFixture, fresh_repo: Callable[[str], Path]
 ) -> None:
-    shutil.unpack_archive(
-        DATA_DIR / "repos" / "git" / "added-no-commits-default-tag.zip", tmp_path
-    )
+    repo_dir = fresh_repo("git/added-no-commits-default-tag.zip")
     assert describe_git_archive(
-        project_dir=tmp_path,
+        project_dir=repo_dir,
         params={"default-tag": "0.0.0", "describe-subst": "$Format:%(describe)$"},
     ) == VCSDescription(
         tag="0.0.0",
         state="dirty",
         branch="main",
-        fields={
-            "distance": 0,
-            "rev": "0000000",
-            "build_date": BUILD_DATE,
-            "vcs": "g",
-            "vcs_name": "git",
-        },
+        fields={**GIT_ARCHIVE_FIELDS, "distance": 0, "rev": "0000000"},
     )
+    records = caplog.record_tuples
     assert any(
         logger == "versioningit"
         and level == logging.ERROR
-        and re.match("^`git describe --long --dirty --always` command failed: ", msg)
-        for logger, level, msg in caplog.record_tuples
+        and msg.startswith("`git describe --long --dirty --always` command failed: ")
+        for logger, level, msg in records
     )
     assert (
         "versioningit",
         logging.INFO,
         "Falling back to default tag '0.0.0'",
-    ) in caplog.record_tuples
+    ) in records
 
 
 @needs_git
-def test_describe_git_archive_lightweight_only(tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "exact.zip", tmp_path)
+def test_describe_git_archive_lightweight_only(
+    fresh_repo: Callable[[str], Path]
+) -> None:
+    repo_dir = fresh_repo("git/exact.zip")
     with pytest.raises(NoTagError) as excinfo:
         describe_git_archive(
-            project_dir=tmp_path,
+            project_dir=repo_dir,
             params={"describe-subst": "$Format:%(describe)$"},
         )
     assert (
@@ -258,26 +289,21 @@ def test_describe_git_archive_lightweight_only(tmp_path: Path) -> None:
 
 @needs_git
 def test_describe_git_archive_lightweight_only_default_tag(
-    caplog: pytest.LogCaptureFixture, tmp_path: Path
+    caplog: pytest.LogCaptureFixture, fresh_repo: Callable[[str], Path]
 ) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "exact.zip", tmp_path)
-    with (DATA_DIR / "repos" / "git" / "exact.exclude.fields.json").open(
-        encoding="utf-8"
-    ) as fp:
-        fields = GitFields.model_validate(json.load(fp))
+    repo_dir = fresh_repo("git/exact.zip")
+    fields = get_git_fields("exact.exclude")
     assert describe_git_archive(
-        project_dir=tmp_path,
+        project_dir=repo_dir,
         params={"default-tag": "0.0.0", "describe-subst": "$Format:%(describe)$"},
     ) == VCSDescription(
         tag="0.0.0",
         state="distance",
         branch="main",
         fields={
-            "distance": fields.distance,
-            "rev": fields.rev,
-            "build_date": BUILD_DATE,
-            "vcs": "g",
-            "vcs_name": "git",
+            **GIT_ARCHIVE_FIELDS,
+            "distance": fields["distance"],
+            "rev": fields["rev"],
         },
     )
     assert (
@@ -289,24 +315,27 @@ def test_describe_git_archive_lightweight_only_default_tag(
 
 
 @needs_git
-def test_ensure_is_repo_not_tracked(tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "git" / "exact.zip", tmp_path)
-    (tmp_path / "subdir").mkdir()
-    (tmp_path / "subdir" / "file.txt").touch()
+def test_ensure_is_repo_not_tracked(fresh_repo: Callable[[str], Path]) -> None:
+    repo_dir = fresh_repo("git/exact.zip")
+    (repo_dir / "subdir").mkdir()
+    (repo_dir / "subdir" / "file.txt").touch()
     with pytest.raises(NotVCSError) as excinfo:
-        GitRepo(tmp_path / "subdir").ensure_is_repo()
-    assert str(excinfo.value) == f"{tmp_path / 'subdir'} is not tracked by Git"
+        GitRepo(repo_dir / "subdir").ensure_is_repo()
+    assert str(excinfo.value) == f"{repo_dir / 'subdir'} is not tracked by Git"
 
 
 @needs_git
-def test_ensure_is_repo_dot_git_dir(tmp_path: Path) -> None:
-    subprocess.run(["git", "init"], check=True, cwd=str(tmp_path))
+def test_ensure_is_repo_dot_git_dir(
+    clone_tree: Callable[[Path, Path], None], empty_git_repo: Path, tmp_path: Path
+) -> None:
+    tmp_path /= "repo"
+    clone_tree(empty_git_repo, tmp_path)
     with pytest.raises(NotVCSError) as excinfo:
         GitRepo(tmp_path / ".git").ensure_is_repo()
     assert str(excinfo.value) == f"{tmp_path / '.git'} is not in a Git working tree"
 
 
-@pytest.mark.skipif(shutil.which("git") is not None, reason="Git must not be installed")
+@pytest.mark.skipif(HAS_GIT, reason="Git must not be installed")
 def test_ensure_is_repo_git_not_installed(tmp_path: Path) -> None:
     with pytest.raises(NotVCSError) as excinfo:
         GitRepo(tmp_path).ensure_is_repo()
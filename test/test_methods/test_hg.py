@@ -1,8 +1,9 @@
 from __future__ import annotations
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import logging
-from operator import attrgetter
 from pathlib import Path
 import shutil
 import subprocess
@@ -13,14 +14,23 @@ from versioningit.core import VCSDescription
 from versioningit.errors import NoTagError, NotVCSError
 from versioningit.hg import HGRepo, describe_hg, parse_hg_archival
 
-needs_hg = pytest.mark.skipif(
-    shutil.which("hg") is None, reason="Mercurial not installed"
-)
+HAS_HG = shutil.which("hg") is not None
+
+needs_hg = pytest.mark.skipif(not HAS_HG, reason="Mercurial not installed")
 
 BUILD_DATE = datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc)
 
 DATA_DIR = Path(__file__).parent.with_name("data")
 
+ARCHIVAL_CASES = [
+    pytest.param(
+        p,
+        json.loads(p.with_suffix(".json").read_bytes()),
+        id=p.stem,
+    )
+    for p in sorted((DATA_DIR / "hg-archival").glob("*.txt"))
+]
+
 
 class HGFields(BaseModel):
     build_date: datetime
@@ -31,6 +41,28 @@ class HGFields(BaseModel):
     vcs_name: str
 
 
+@lru_cache(maxsize=None)
+def get_hg_fields(name: str) -> dict[str, Any]:
+    """
+    Load & validate the expected fields for the Mercurial test repository ``name``.
+    The result is cached and so must not be modified.
+    """
+    path = DATA_DIR / "repos" / "hg" / f"{name}.fields.json"
+    return HGFields.model_validate_json(path.read_bytes()).model_dump()
+
+
+@pytest.fixture(scope="session")
+def empty_hg_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Returns the path to a freshly-initialized Mercurial repository with no
+    commits.  The repository is shared across the session and must not be
+    modified.
+    """
+    path = tmp_path_factory.mktemp("hg-empty")
+    subprocess.run(["hg", "--cwd", path, "init"], check=True)
+    return path
+
+
 @needs_hg
 @pytest.mark.parametrize(
     "repo,params,tag,state",
@@ -49,20 +81,20 @@ class HGFields(BaseModel):
     ],
 )
 def test_describe_hg(
-    repo: str, params: dict[str, Any], tag: str, state: str, tmp_path: Path
+    fresh_repo: Callable[[str], Path],
+    repo: str,
+    params: dict[str, Any],
+    tag: str,
+    state: str,
 ) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "hg" / f"{repo}.zip", tmp_path)
-    with (DATA_DIR / "repos" / "hg" / f"{repo}.fields.json").open(
-        encoding="utf-8"
-    ) as fp:
-        fields = HGFields.model_validate(json.load(fp))
+    repo_dir = fresh_repo(f"hg/{repo}.zip")
     description = VCSDescription(
         tag=tag,
         state=state,
         branch="default",
-        fields=fields.model_dump(),
+        fields=get_hg_fields(repo),
     )
-    desc = describe_hg(project_dir=tmp_path, params=params)
+    desc = describe_hg(project_dir=repo_dir, params=params)
     assert desc == description
     assert desc.fields["build_date"].tzinfo is timezone.utc
 
@@ -74,10 +106,10 @@ def test_describe_hg(
         "archives/hg-archive-default-tag.zip",
     ],
 )
-def test_describe_hg_no_tag(repo: str, tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / repo, tmp_path)
+def test_describe_hg_no_tag(fresh_repo: Callable[[str], Path], repo: str) -> None:
+    repo_dir = fresh_repo(repo)
     with pytest.raises(NoTagError) as excinfo:
-        describe_hg(project_dir=tmp_path, params={})
+        describe_hg(project_dir=repo_dir, params={})
     assert str(excinfo.value) == "No latest tag in Mercurial repository"
 
 
@@ -90,32 +122,34 @@ def test_describe_hg_no_repo(tmp_path: Path) -> None:
 
 @needs_hg
 @pytest.mark.parametrize("params", [{}, {"default-tag": "0.0.0"}])
-def test_describe_hg_no_commits(tmp_path: Path, params: dict[str, Any]) -> None:
-    subprocess.run(["hg", "--cwd", str(tmp_path), "init"], check=True)
+def test_describe_hg_no_commits(
+    clone_tree: Callable[[Path, Path], None],
+    empty_hg_repo: Path,
+    tmp_path: Path,
+    params: dict[str, Any],
+) -> None:
+    tmp_path /= "repo"
+    clone_tree(empty_hg_repo, tmp_path)
     with pytest.raises(NotVCSError) as excinfo:
         describe_hg(project_dir=tmp_path, params=params)
     assert str(excinfo.value) == f"{tmp_path} is not tracked by Mercurial"
 
 
 @needs_hg
-def test_describe_hg_added_no_commits(tmp_path: Path) -> None:
-    shutil.unpack_archive(
-        DATA_DIR / "repos" / "hg" / "added-no-commits-default-tag.zip", tmp_path
-    )
+def test_describe_hg_added_no_commits(fresh_repo: Callable[[str], Path]) -> None:
+    repo_dir = fresh_repo("hg/added-no-commits-default-tag.zip")
     with pytest.raises(NoTagError) as excinfo:
-        describe_hg(project_dir=tmp_path, params={})
+        describe_hg(project_dir=repo_dir, params={})
     assert str(excinfo.value) == "No latest tag in Mercurial repository"
 
 
 @needs_hg
 def test_describe_hg_added_no_commits_default_tag(
-    caplog: pytest.LogCaptureFixture, tmp_path: Path
+    caplog: pytest.LogCaptureFixture, fresh_repo: Callable[[str], Path]
 ) -> None:
-    shutil.unpack_archive(
-        DATA_DIR / "repos" / "hg" / "added-no-commits-default-tag.zip", tmp_path
-    )
+    repo_dir = fresh_repo("hg/added-no-commits-default-tag.zip")
     assert describe_hg(
-        project_dir=tmp_path, params={"default-tag": "0.0.0"}
+        project_dir=repo_dir, params={"default-tag": "0.0.0"}
     ) == VCSDescription(
         tag="0.0.0",
         state="dirty",
@@ -137,26 +171,27 @@ def test_describe_hg_added_no_commits_default_tag(
 
 
 @needs_hg
-def test_ensure_is_repo_not_tracked(tmp_path: Path) -> None:
-    shutil.unpack_archive(DATA_DIR / "repos" / "hg" / "exact.zip", tmp_path)
-    (tmp_path / "subdir").mkdir()
-    (tmp_path / "subdir" / "file.txt").touch()
+def test_ensure_is_repo_not_tracked(fresh_repo: Callable[[str], Path]) -> None:
+    repo_dir = fresh_repo("hg/exact.zip")
+    (repo_dir / "subdir").mkdir()
+    (repo_dir / "subdir" / "file.txt").touch()
     with pytest.raises(NotVCSError) as excinfo:
-        HGRepo(tmp_path / "subdir").ensure_is_repo()
-    assert str(excinfo.value) == f"{tmp_path / 'subdir'} is not tracked by Mercurial"
+        HGRepo(repo_dir / "subdir").ensure_is_repo()
+    assert str(excinfo.value) == f"{repo_dir / 'subdir'} is not tracked by Mercurial"
 
 
 @needs_hg
-def test_ensure_is_repo_dot_hg_dir(tmp_path: Path) -> None:
-    subprocess.run(["hg", "--cwd", str(tmp_path), "init"], check=True)
+def test_ensure_is_repo_dot_hg_dir(
+    clone_tree: Callable[[Path, Path], None], empty_hg_repo: Path, tmp_path: Path
+) -> None:
+    tmp_path /= "repo"
+    clone_tree(empty_hg_repo, tmp_path)
     with pytest.raises(NotVCSError) as excinfo:
         HGRepo(tmp_path / ".hg").ensure_is_repo()
     assert str(excinfo.value) == f"{tmp_path / '.hg'} is not tracked by Mercurial"
 
 
-@pytest.mark.skipif(
-    shutil.which("hg") is not None, reason="Mercurial must not be installed"
-)
+@pytest.mark.skipif(HAS_HG, reason="Mercurial must not be installed")
 def test_ensure_is_repo_hg_not_installed(tmp_path: Path) -> None:
     with pytest.raises(NotVCSError) as excinfo:
         HGRepo(tmp_path).ensure_is_repo()
@@ -166,12 +201,6 @@ def test_ensure_is_repo_hg_not_installed(tmp_path: Path) -> None:
     )
 
 
-@pytest.mark.parametrize(
-    "archival_file",
-    sorted((DATA_DIR / "hg-archival").glob("*.txt")),
-    ids=attrgetter("stem"),
-)
-def test_parse_hg_archival(archival_file: Path) -> None:
-    assert parse_hg_archival(archival_file) == json.loads(
-        archival_file.with_suffix(".json").read_text(encoding="utf-8")
-    )
+@pytest.mark.parametrize("archival_file,expected", ARCHIVAL_CASES)
+def test_parse_hg_archival(archival_file: Path, expected: dict[str, str]) -> None:
+    assert parse_hg_archival(archival_file) == expected
@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import os
 from pathlib import Path
-from shutil import copytree
+import re
 from typing import TYPE_CHECKING, Any
 import pytest
 from versioningit.errors import ConfigError
@@ -18,190 +18,220 @@ if TYPE_CHECKING:
 
 DATA_DIR = Path(__file__).parent.with_name("data")
 
+BUILD_DATE = datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc)
 
-@pytest.mark.parametrize(
-    "outfile,is_source,params",
-    [
-        (
-            "source.py",
-            True,
-            {"source-file": "source_file.py", "build-file": "wheel_file.py"},
-        ),
-        (
-            "not-source.py",
-            False,
-            {"source-file": "source_file.py", "build-file": "wheel_file.py"},
-        ),
-        (
-            "replacement.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "replacement": 'importlib.metadata.version("mypackage")',
-            },
-        ),
-        (
-            "with-date.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "replacement": (
-                    '"{version}"\n__build_date__ = "{build_date:%Y%m%dT%H%M%SZ}"'
-                ),
-            },
-        ),
-        (
-            "line2block.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^__version__ =.*\s*$",
-                "replacement": (
-                    "try:\n    from importlib.metadata import version\n"
-                    "except ImportError:\n"
-                    "    from importlib_metadata import version\n\n"
-                    '__version__ = version("mypackage")\n'
-                ),
-            },
-        ),
-        (
-            "nomatch.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^does-not-match",
-            },
-        ),
-        (
-            "append.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^does-not-match",
-                "append-line": "VERSION = '{version}'",
-            },
-        ),
-        (
-            "append-with-date.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^does-not-match",
-                "append-line": (
-                    "VERSION = '{version}'\n"
-                    "BUILD_DATE = '{build_date:%Y-%m-%dT%H:%M:%SZ}'"
-                ),
-            },
-        ),
-        (
-            "append-newline.py",
-            True,
-            {
-                "source-file": "source_file.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^does-not-match",
-                "append-line": "VERSION = '{version}'\n",
-            },
-        ),
-        (
-            "multi-matches.py",
-            True,
-            {"source-file": "repeats.py", "build-file": "wheel_file.py"},
-        ),
-        (
-            "latin1-edited.txt",
-            True,
-            {
-                "source-file": "latin1.txt",
-                "build-file": "wheel_file.py",
-                "encoding": "iso-8859-1",
-                "regex": "«»",
-                "replacement": "{version}",
-            },
-        ),
-        (
-            "still-empty.py",
-            True,
-            {"source-file": "empty.py", "build-file": "wheel_file.py"},
-        ),
-        (
-            "set-line.py",
-            True,
-            {
-                "source-file": "empty.py",
-                "build-file": "wheel_file.py",
-                "append-line": '__version__ = "{version}"',
-            },
-        ),
-        (
-            "replace-nonl.py",
-            True,
-            {
-                "source-file": "comment.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^(\s*#+)(?s:.*)",
-                "replacement": r"\1 {version}",
-            },
-        ),
-        (
-            "nl-append.txt",
-            True,
-            {
-                "source-file": "no-eof-nl.dat",
-                "build-file": "wheel_file.py",
-                "append-line": "{version}",
-            },
-        ),
-        (
-            "line-sepped.py",
-            True,
-            {
-                "source-file": "line-sep.py",
-                "build-file": "wheel_file.py",
-                "regex": r"^\s*__version__\s*=\s+(?P<version>.+?)\s+",
-            },
-        ),
-    ],
-)
+BASE_DIR = DATA_DIR / "replace-version" / "base"
+
+BASE_FILES = {p.name: p.read_bytes() for p in BASE_DIR.iterdir()}
+
+BAD_REGEX_MSG = re.compile(r"^versioningit: onbuild\.regex: Invalid regex: .+")
+
+
+@pytest.fixture(scope="session")
+def base_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Returns the path to a session-wide copy of ``replace-version/base`` that
+    `linked_base` hardlinks to.  The copy must not be modified.
+    """
+    path = tmp_path_factory.mktemp("replace-version")
+    for name, data in BASE_FILES.items():
+        (path / name).write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def linked_base(base_tree: Path, tmp_path: Path) -> Path:
+    """
+    Returns a directory populated with hard links to the files in `base_tree`
+    (or with copies of them if hard links are not supported).  This is safe
+    because `SetuptoolsFileProvider` breaks hard links before writing to a
+    file, as setuptools itself may hardlink build files.
+    """
+    path = tmp_path / "build"
+    path.mkdir()
+    for name, data in BASE_FILES.items():
+        try:
+            os.link(base_tree / name, path / name)
+        except OSError:
+            (path / name).write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def provider_dirs(tmp_path: Path) -> tuple[Path, Path]:
+    """
+    Returns a pair of empty directories for use as a file provider's source
+    directory and its build/temporary directory
+    """
+    src_dir = tmp_path / "src"
+    build_dir = tmp_path / "build"
+    src_dir.mkdir()
+    build_dir.mkdir()
+    return (src_dir, build_dir)
+
+
+BASE_PARAMS = {"source-file": "source_file.py", "build-file": "wheel_file.py"}
+
+REPLACE_VERSION_CASES = [
+    ("source.py", True, BASE_PARAMS),
+    ("not-source.py", False, BASE_PARAMS),
+    (
+        "replacement.py",
+        True,
+        {**BASE_PARAMS, "replacement": 'importlib.metadata.version("mypackage")'},
+    ),
+    (
+        "with-date.py",
+        True,
+        {
+            **BASE_PARAMS,
+            "replacement": (
+                '"{version}"\n__build_date__ = "{build_date:%Y%m%dT%H%M%SZ}"'
+            ),
+        },
+    ),
+    (
+        "line2block.py",
+        True,
+        {
+            **BASE_PARAMS,
+            "regex": r"^__version__ =.*\s*$",
+            "replacement": (
+                "try:\n    from importlib.metadata import version\n"
+                "except ImportError:\n"
+                "    from importlib_metadata import version\n\n"
+                '__version__ = version("mypackage")\n'
+            ),
+        },
+    ),
+    ("nomatch.py", True, {**BASE_PARAMS, "regex": r"^does-not-match"}),
+    (
+        "append.py",
+        True,
+        {
+            **BASE_PARAMS,
+            "regex": r"^does-not-match",
+            "append-line": "VERSION = '{version}'",
+        },
+    ),
+    (
+        "append-with-date.py",
+        True,
+        {
+            **BASE_PARAMS,
+            "regex": r"^does-not-match",
+            "append-line": (
+                "VERSION = '{version}'\n"
+                "BUILD_DATE = '{build_date:%Y-%m-%dT%H:%M:%SZ}'"
+            ),
+        },
+    ),
+    (
+        "append-newline.py",
+        True,
+        {
+            **BASE_PARAMS,
+            "regex": r"^does-not-match",
+            "append-line": "VERSION = '{version}'\n",
+        },
+    ),
+    (
+        "multi-matches.py",
+        True,
+        {"source-file": "repeats.py", "build-file": "wheel_file.py"},
+    ),
+    (
+        "latin1-edited.txt",
+        True,
+        {
+            "source-file": "latin1.txt",
+            "build-file": "wheel_file.py",
+            "encoding": "iso-8859-1",
+            "regex": "«»",
+            "replacement": "{version}",
+        },
+    ),
+    (
+        "still-empty.py",
+        True,
+        {"source-file": "empty.py", "build-file": "wheel_file.py"},
+    ),
+    (
+        "set-line.py",
+        True,
+        {
+            "source-file": "empty.py",
+            "build-file": "wheel_file.py",
+            "append-line": '__version__ = "{version}"',
+        },
+    ),
+    (
+        "replace-nonl.py",
+        True,
+        {
+            "source-file": "comment.py",
+            "build-file": "wheel_file.py",
+            "regex": r"^(\s*#+)(?s:.*)",
+            "replacement": r"\1 {version}",
+        },
+    ),
+    (
+        "nl-append.txt",
+        True,
+        {
+            "source-file": "no-eof-nl.dat",
+            "build-file": "wheel_file.py",
+            "append-line": "{version}",
+        },
+    ),
+    (
+        "line-sepped.py",
+        True,
+        {
+            "source-file": "line-sep.py",
+            "build-file": "wheel_file.py",
+            "regex": r"^\s*__version__\s*=\s+(?P<version>.+?)\s+",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("outfile,is_source,params", REPLACE_VERSION_CASES)
 def test_replace_version_onbuild(
-    outfile: str, is_source: bool, params: dict[str, Any], tmp_path: Path
+    base_tree: Path,
+    linked_base: Path,
+    outfile: str,
+    is_source: bool,
+    params: dict[str, Any],
 ) -> None:
-    src_dir = DATA_DIR / "replace-version" / "base"
-    tmp_path /= "tmp"  # copytree() can't copy to a dir that already exists
-    copytree(src_dir, tmp_path)
     replace_version_onbuild(
-        file_provider=SetuptoolsFileProvider(build_dir=tmp_path),
+        file_provider=SetuptoolsFileProvider(build_dir=linked_base),
         is_source=is_source,
         template_fields={
             "version": "1.2.3",
-            "build_date": datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc),
+            "build_date": BUILD_DATE,
         },
         params=params,
     )
     modfile = params["source-file" if is_source else "build-file"]
     encoding = params.get("encoding", "utf-8")
-    for p in tmp_path.iterdir():
-        if p.name == modfile:
-            assert p.read_text(encoding=encoding) == (
-                DATA_DIR / "replace-version" / outfile
-            ).read_text(encoding=encoding)
-        else:
-            assert p.read_bytes() == (src_dir / p.name).read_bytes()
+    assert {p.name for p in linked_base.iterdir()} == BASE_FILES.keys()
+    if (linked_base / modfile).read_bytes() != BASE_FILES[modfile]:
+        # The file must have been unlinked from the shared base_tree copy
+        # rather than written through the link.
+        assert not (linked_base / modfile).samefile(base_tree / modfile)
+    assert (linked_base / modfile).read_text(encoding=encoding) == (
+        DATA_DIR / "replace-version" / outfile
+    ).read_text(encoding=encoding)
+    for name, data in BASE_FILES.items():
+        if name != modfile:
+            assert (linked_base / name).read_bytes() == data
 
 
-def test_replace_version_onbuild_require_match(tmp_path: Path) -> None:
-    src_dir = DATA_DIR / "replace-version" / "base"
-    tmp_path /= "tmp"  # copytree() can't copy to a dir that already exists
-    copytree(src_dir, tmp_path)
+def test_replace_version_onbuild_require_match(linked_base: Path) -> None:
     with pytest.raises(RuntimeError) as excinfo:
         replace_version_onbuild(
-            file_provider=SetuptoolsFileProvider(build_dir=tmp_path),
+            file_provider=SetuptoolsFileProvider(build_dir=linked_base),
             is_source=True,
             template_fields={"version": "1.2.3"},
             params={
@@ -214,19 +244,14 @@ def test_replace_version_onbuild_require_match(tmp_path: Path) -> None:
     assert (
         str(excinfo.value) == "onbuild.regex did not match any lines in source_file.py"
     )
-    for p in tmp_path.iterdir():
-        assert p.read_bytes() == (src_dir / p.name).read_bytes()
+    for p in linked_base.iterdir():
+        assert p.read_bytes() == BASE_FILES[p.name]
 
 
-def test_replace_version_onbuild_bad_regex(tmp_path: Path) -> None:
-    src_dir = DATA_DIR / "replace-version" / "base"
-    tmp_path /= "tmp"  # copytree() can't copy to a dir that already exists
-    copytree(src_dir, tmp_path)
-    with pytest.raises(
-        ConfigError, match=r"^versioningit: onbuild\.regex: Invalid regex: .+"
-    ):
+def test_replace_version_onbuild_bad_regex(linked_base: Path) -> None:
+    with pytest.raises(ConfigError, match=BAD_REGEX_MSG):
         replace_version_onbuild(
-            file_provider=SetuptoolsFileProvider(build_dir=tmp_path),
+            file_provider=SetuptoolsFileProvider(build_dir=linked_base),
             is_source=True,
             template_fields={"version": "1.2.3"},
             params={
@@ -235,17 +260,14 @@ def test_replace_version_onbuild_bad_regex(tmp_path: Path) -> None:
                 "regex": "(?<foo>)",
             },
         )
-    for p in tmp_path.iterdir():
-        assert p.read_bytes() == (src_dir / p.name).read_bytes()
+    for p in linked_base.iterdir():
+        assert p.read_bytes() == BASE_FILES[p.name]
 
 
-def test_replace_version_onbuild_version_not_captured(tmp_path: Path) -> None:
-    src_dir = DATA_DIR / "replace-version" / "base"
-    tmp_path /= "tmp"  # copytree() can't copy to a dir that already exists
-    copytree(src_dir, tmp_path)
+def test_replace_version_onbuild_version_not_captured(linked_base: Path) -> None:
     with pytest.raises(RuntimeError) as excinfo:
         replace_version_onbuild(
-            file_provider=SetuptoolsFileProvider(build_dir=tmp_path),
+            file_provider=SetuptoolsFileProvider(build_dir=linked_base),
             is_source=True,
             template_fields={"version": "1.2.3"},
             params={
@@ -258,8 +280,8 @@ def test_replace_version_onbuild_version_not_captured(tmp_path: Path) -> None:
         "'version' group in versioningit's onbuild.regex did"
         " not participate in match"
     )
-    for p in tmp_path.iterdir():
-        assert p.read_bytes() == (src_dir / p.name).read_bytes()
+    for p in linked_base.iterdir():
+        assert p.read_bytes() == BASE_FILES[p.name]
 
 
 @pytest.mark.parametrize("is_source", [False, True])
@@ -307,12 +329,12 @@ def test_setuptools_file_provider_read_write_read(
     ],
 )
 def test_setuptools_file_provider_read_write_read_hard_link(
-    is_source: bool, mode: Literal["w", "a"], after: str, tmp_path: Path
+    is_source: bool,
+    mode: Literal["w", "a"],
+    after: str,
+    provider_dirs: tuple[Path, Path],
 ) -> None:
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    build_dir = tmp_path / "build"
-    build_dir.mkdir()
+    src_dir, build_dir = provider_dirs
     (src_dir / "apple.txt").write_text("Apple\n")
     if is_source:
         os.link(src_dir / "apple.txt", build_dir / "apple.txt")
@@ -348,12 +370,12 @@ def test_setuptools_file_provider_read_write_read_hard_link(
     ],
 )
 def test_hatch_file_provider_read_write_read(
-    is_source: bool, mode: Literal["w", "a"], after: str, tmp_path: Path
+    is_source: bool,
+    mode: Literal["w", "a"],
+    after: str,
+    provider_dirs: tuple[Path, Path],
 ) -> None:
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    tmp_dir = tmp_path / "tmp"
-    tmp_dir.mkdir()
+    src_dir, tmp_dir = provider_dirs
     (src_dir / "apple.txt").write_text("Apple\n")
     provider = HatchFileProvider(src_dir=src_dir, tmp_dir=tmp_dir)
     file = provider.get_file(
@@ -380,12 +402,12 @@ def test_hatch_file_provider_read_write_read(
 @pytest.mark.parametrize("is_source", [False, True])
 @pytest.mark.parametrize("mode", ["w", "a"])
 def test_file_provider_write_new_file(
-    backend: str, is_source: bool, mode: Literal["w", "a"], tmp_path: Path
+    backend: str,
+    is_source: bool,
+    mode: Literal["w", "a"],
+    provider_dirs: tuple[Path, Path],
 ) -> None:
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    build_dir = tmp_path / "build"
-    build_dir.mkdir()
+    src_dir, build_dir = provider_dirs
     provider: OnbuildFileProvider
     if backend == "setuptools":
         provider = SetuptoolsFileProvider(build_dir=build_dir)
@@ -6,6 +6,8 @@ import pytest
 from versioningit.basics import basic_write
 from versioningit.errors import ConfigError
 
+BUILD_DATE = datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc)
+
 
 @pytest.mark.parametrize(
     "filename,params,content",
@@ -38,7 +40,7 @@ def test_basic_write(
         project_dir=tmp_path,
         template_fields={
             "version": "1.2.3",
-            "build_date": datetime(2038, 1, 19, 3, 14, 7, tzinfo=timezone.utc),
+            "build_date": BUILD_DATE,
         },
         params={"file": filename, **params},
     )
@@ -70,6 +70,12 @@ def test_get_build_date_now(monkeypatch: pytest.MonkeyPatch) -> None:
     assert timedelta(seconds=0) <= (now - dt) <= timedelta(seconds=2)
 
 
+def test_get_build_date_padded_epoch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", " 1234567890\n")
+    dt = get_build_date()
+    assert dt == datetime(2009, 2, 13, 23, 31, 30, tzinfo=timezone.utc)
+
+
 def test_get_build_date_bad_epoch(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SOURCE_DATE_EPOCH", "2009-02-13T23:31:30Z")
     dt = get_build_date()
@@ -200,148 +206,148 @@ def test_parse_version_from_metadata_bad(filename: str) -> None:
     assert str(excinfo.value) == "Metadata does not contain a Version field"
 
 
-@pytest.mark.parametrize(
-    "fmt,opts,args",
-    [
-        ("$Format:%(describe)$", DescribeOpts(tags=False, match=[], exclude=[]), []),
-        ("$Format:%(describe:)$", DescribeOpts(tags=False, match=[], exclude=[]), []),
-        (
-            "$Format:%(describe:tags)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags,)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=yes)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=YES)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=Yes)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=on)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=ON)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=true)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=True)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=1)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:tags=no)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=No)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=off)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=OFF)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=false)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=fAlsE)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=0)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=ja)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=yes,tags=)$",
-            DescribeOpts(tags=False, match=[], exclude=[]),
-            [],
-        ),
-        (
-            "$Format:%(describe:tags=,tags=yes)$",
-            DescribeOpts(tags=True, match=[], exclude=[]),
-            ["--tags"],
-        ),
-        (
-            "$Format:%(describe:match=v*)$",
-            DescribeOpts(tags=False, match=["v*"], exclude=[]),
-            ["--match=v*"],
-        ),
-        (
-            "$Format:%(describe:match=v*,match=rel*)$",
-            DescribeOpts(tags=False, match=["v*", "rel*"], exclude=[]),
-            ["--match=v*", "--match=rel*"],
-        ),
-        (
-            "$Format:%(describe:match=v*,exclude=*rc,match=rel*)$",
-            DescribeOpts(tags=False, match=["v*", "rel*"], exclude=["*rc"]),
-            ["--match=v*", "--match=rel*", "--exclude=*rc"],
-        ),
-        (
-            "$Format:%(describe:match=v*,tags,exclude=*rc,match=rel*)$",
-            DescribeOpts(tags=True, match=["v*", "rel*"], exclude=["*rc"]),
-            ["--tags", "--match=v*", "--match=rel*", "--exclude=*rc"],
-        ),
-        (
-            "$Format:%(describe:exclude=\\,)$",
-            DescribeOpts(tags=False, match=[], exclude=["\\"]),
-            ["--exclude=\\"],
-        ),
-        (
-            "$Format:%(describe:exclude=\\*,)$",
-            DescribeOpts(tags=False, match=[], exclude=["\\*"]),
-            ["--exclude=\\*"],
-        ),
-    ],
-)
+DESCRIBE_OPTS_CASES = [
+    ("$Format:%(describe)$", DescribeOpts(tags=False, match=[], exclude=[]), []),
+    ("$Format:%(describe:)$", DescribeOpts(tags=False, match=[], exclude=[]), []),
+    (
+        "$Format:%(describe:tags)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags,)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=yes)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=YES)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=Yes)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=on)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=ON)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=true)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=True)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=1)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:tags=no)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=No)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=off)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=OFF)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=false)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=fAlsE)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=0)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=ja)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=yes,tags=)$",
+        DescribeOpts(tags=False, match=[], exclude=[]),
+        [],
+    ),
+    (
+        "$Format:%(describe:tags=,tags=yes)$",
+        DescribeOpts(tags=True, match=[], exclude=[]),
+        ["--tags"],
+    ),
+    (
+        "$Format:%(describe:match=v*)$",
+        DescribeOpts(tags=False, match=["v*"], exclude=[]),
+        ["--match=v*"],
+    ),
+    (
+        "$Format:%(describe:match=v*,match=rel*)$",
+        DescribeOpts(tags=False, match=["v*", "rel*"], exclude=[]),
+        ["--match=v*", "--match=rel*"],
+    ),
+    (
+        "$Format:%(describe:match=v*,exclude=*rc,match=rel*)$",
+        DescribeOpts(tags=False, match=["v*", "rel*"], exclude=["*rc"]),
+        ["--match=v*", "--match=rel*", "--exclude=*rc"],
+    ),
+    (
+        "$Format:%(describe:match=v*,tags,exclude=*rc,match=rel*)$",
+        DescribeOpts(tags=True, match=["v*", "rel*"], exclude=["*rc"]),
+        ["--tags", "--match=v*", "--match=rel*", "--exclude=*rc"],
+    ),
+    (
+        "$Format:%(describe:exclude=\\,)$",
+        DescribeOpts(tags=False, match=[], exclude=["\\"]),
+        ["--exclude=\\"],
+    ),
+    (
+        "$Format:%(describe:exclude=\\*,)$",
+        DescribeOpts(tags=False, match=[], exclude=["\\*"]),
+        ["--exclude=\\*"],
+    ),
+]
+
+
+@pytest.mark.parametrize("fmt,opts,args", DESCRIBE_OPTS_CASES)
 def test_parse_describe_opts(fmt: str, opts: DescribeOpts, args: list[str]) -> None:
     actual = DescribeOpts.parse_describe_subst(fmt)
     assert actual == opts
@@ -400,33 +406,33 @@ def test_split_version(
     assert split_version(v, split_on, double_quote) == vtuple
 
 
-@pytest.mark.parametrize(
-    "v,double_quote,epoch,vtuple",
-    [
-        ("1.2.3", True, None, "(1, 2, 3)"),
-        ("1.2.3", True, True, "(0, 1, 2, 3)"),
-        ("1.2.3", True, False, "(1, 2, 3)"),
-        ("1!2.3.4", True, None, "(1, 2, 3, 4)"),
-        ("1!2.3.4", True, True, "(1, 2, 3, 4)"),
-        ("1!2.3.4", True, False, "(2, 3, 4)"),
-        ("0.1.0", True, None, "(0, 1, 0)"),
-        ("1.0.0.0", True, None, "(1, 0, 0, 0)"),
-        ("1.2.3a0", True, None, '(1, 2, 3, "a0")'),
-        ("1.2.3a0.dev1", True, None, '(1, 2, 3, "a0", "dev1")'),
-        ("1.2.3a0.dev1", False, None, "(1, 2, 3, 'a0', 'dev1')"),
-        ("1.2.3a0.post1", True, None, '(1, 2, 3, "a0", "post1")'),
-        ("1.2.3-1", True, None, '(1, 2, 3, "post1")'),
-        ("1.2.3a0.post1.dev1", True, None, '(1, 2, 3, "a0", "post1", "dev1")'),
-        (
-            "1.2.3a0.post1.dev1+local",
-            True,
-            None,
-            '(1, 2, 3, "a0", "post1", "dev1", "+local")',
-        ),
-        ("1.2.3.dev1", True, None, '(1, 2, 3, "dev1")'),
-        ("1.2.3+local", True, None, '(1, 2, 3, "+local")'),
-    ],
-)
+SPLIT_PEP440_CASES = [
+    ("1.2.3", True, None, "(1, 2, 3)"),
+    ("1.2.3", True, True, "(0, 1, 2, 3)"),
+    ("1.2.3", True, False, "(1, 2, 3)"),
+    ("1!2.3.4", True, None, "(1, 2, 3, 4)"),
+    ("1!2.3.4", True, True, "(1, 2, 3, 4)"),
+    ("1!2.3.4", True, False, "(2, 3, 4)"),
+    ("0.1.0", True, None, "(0, 1, 0)"),
+    ("1.0.0.0", True, None, "(1, 0, 0, 0)"),
+    ("1.2.3a0", True, None, '(1, 2, 3, "a0")'),
+    ("1.2.3a0.dev1", True, None, '(1, 2, 3, "a0", "dev1")'),
+    ("1.2.3a0.dev1", False, None, "(1, 2, 3, 'a0', 'dev1')"),
+    ("1.2.3a0.post1", True, None, '(1, 2, 3, "a0", "post1")'),
+    ("1.2.3-1", True, None, '(1, 2, 3, "post1")'),
+    ("1.2.3a0.post1.dev1", True, None, '(1, 2, 3, "a0", "post1", "dev1")'),
+    (
+        "1.2.3a0.post1.dev1+local",
+        True,
+        None,
+        '(1, 2, 3, "a0", "post1", "dev1", "+local")',
+    ),
+    ("1.2.3.dev1", True, None, '(1, 2, 3, "dev1")'),
+    ("1.2.3+local", True, None, '(1, 2, 3, "+local")'),
+]
+
+
+@pytest.mark.parametrize("v,double_quote,epoch,vtuple", SPLIT_PEP440_CASES)
 def test_split_pep440_version(
     v: str, double_quote: bool, epoch: Optional[bool], vtuple: str
 ) -> None:
@@ -463,6 +469,8 @@ def test_qqrepr(ins: str, outs: str) -> None:
         ("foobar\r", "foobar\r"),
         ("foobar\r\n", "foobar\r\n"),
         ("foobar\n\r", "foobar\n\r"),
+        ("foobar\x85", "foobar\x85"),
+        ("foobar\u2029", "foobar\u2029"),
         ("foo\nbar", "foo\nbar\n"),
     ],
 )